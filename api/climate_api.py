@@ -4,15 +4,21 @@ FastAPI application for serving CMIP6 climate data.
 This API provides endpoints to query climate data by metric, scenario, and year,
 returning data that can be joined client-side with the geometry tiles.
 """
-from fastapi import FastAPI, HTTPException, Query
+from fastapi import BackgroundTasks, FastAPI, HTTPException, Query, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
-import psycopg2 # type: ignore [import-untyped]
-from psycopg2.extras import RealDictCursor # type: ignore [import-untyped]
+import asyncpg # type: ignore [import-untyped]
+import numpy as np
+import orjson
 import os
 import asyncio
-from contextlib import contextmanager, asynccontextmanager
+import hashlib
+import time
+from collections import OrderedDict
+from contextlib import asynccontextmanager, suppress
 from datetime import datetime
+from pathlib import Path
 
 # Configuration
 DATABASE_CONFIG = {
@@ -22,6 +28,274 @@ DATABASE_CONFIG = {
     'user': os.getenv('DB_USER', 'postgres'),
     'password': os.getenv('DB_PASSWORD', 'postgres')
 }
+POOL_MIN_SIZE = int(os.getenv('DB_POOL_MIN_SIZE', 5))
+POOL_MAX_SIZE = int(os.getenv('DB_POOL_MAX_SIZE', 20))
+POOL_MAX_INACTIVE_LIFETIME = 300  # seconds before an idle pooled connection is closed
+# Worker processes when run as a script; each opens its own pool, so keep
+# WEB_CONCURRENCY * DB_POOL_MAX_SIZE under Postgres' max_connections (100 by default)
+WEB_CONCURRENCY = int(os.getenv('WEB_CONCURRENCY', 2))
+RESPONSE_CACHE_SIZE = 2048
+# Per-worker byte budget for cached payloads, and the largest payload worth caching
+RESPONSE_CACHE_MAX_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_BYTES', 256 * 1024 * 1024))
+RESPONSE_CACHE_MAX_ENTRY_BYTES = int(os.getenv('RESPONSE_CACHE_MAX_ENTRY_BYTES', 16 * 1024 * 1024))
+# Reseeding can change a payload under the same URL, so reuse is bounded to the
+# reference data refresh interval and clients revalidate with the ETag afterwards
+HTTP_CACHE_CONTROL = "public, max-age=300"
+AVERAGE_CACHE_SIZE = 100_000
+AVERAGE_CACHE_TTL = 3600  # seconds
+REGION_CENTER_CACHE_SIZE = 65536
+REGION_CENTER_CACHE_TTL = 3600  # seconds, bounds staleness after regions are reseeded
+CURSOR_PREFETCH = 10000
+# Open year bounds for time series requests without start_year/end_year
+TIMESERIES_MIN_YEAR = 0
+TIMESERIES_MAX_YEAR = 9999
+REFERENCE_CACHE_REFRESH_INTERVAL = 300  # seconds
+# asyncpg prepares and caches every statement per connection; keep the hot
+# queries below as constant SQL text so repeat requests skip parse/plan
+STATEMENT_CACHE_SIZE = 1024
+
+# Hot query statements
+YEARS_RANGE_SQL = """
+    SELECT MIN(year) as min_year, MAX(year) as max_year
+    FROM climate_data
+    WHERE metric_id = $1 AND scenario_id = $2;
+"""
+
+CLIMATE_BY_YEAR_SQL = """
+    SELECT region_id, value
+    FROM climate_data
+    WHERE metric_id = $1
+        AND scenario_id = $2
+        AND year = $3
+        AND value IS NOT NULL
+"""
+
+CLIMATE_BY_YEAR_REGIONS_SQL = """
+    SELECT region_id, value
+    FROM climate_data
+    WHERE metric_id = $1
+        AND scenario_id = $2
+        AND year = $3
+        AND region_id = ANY($4::int[])
+        AND value IS NOT NULL
+"""
+
+# Sorting is opt-in, clients usually key the rows by region_id anyway
+CLIMATE_BY_YEAR_SORTED_SQL = CLIMATE_BY_YEAR_SQL + "    ORDER BY region_id\n"
+CLIMATE_BY_YEAR_REGIONS_SORTED_SQL = CLIMATE_BY_YEAR_REGIONS_SQL + "    ORDER BY region_id\n"
+
+CLIMATE_SUMMARY_SQL = """
+    SELECT MIN(value) as min_value, MAX(value) as max_value,
+           AVG(value) as mean_value, COUNT(value) as count
+    FROM climate_data
+    WHERE metric_id = $1
+        AND scenario_id = $2
+        AND year = $3;
+"""
+
+CLIMATE_SUMMARY_REGIONS_SQL = """
+    SELECT MIN(value) as min_value, MAX(value) as max_value,
+           AVG(value) as mean_value, COUNT(value) as count
+    FROM climate_data
+    WHERE metric_id = $1
+        AND scenario_id = $2
+        AND year = $3
+        AND region_id = ANY($4::int[]);
+"""
+
+# Columnar /climate responses: Postgres aggregates the rows into JSON arrays
+# ordered by region_id and computes the summary in the same pass, with the
+# linear unit conversion value * $4 + $5 applied server side
+CLIMATE_COLUMNAR_SQL = """
+    SELECT
+        json_build_object(
+            'region_id', json_agg(region_id ORDER BY region_id),
+            'value', json_agg(value::float8 * $4 + $5 ORDER BY region_id)
+        )::text as data,
+        MIN(value)::float8 * $4 + $5 as min_value,
+        MAX(value)::float8 * $4 + $5 as max_value,
+        AVG(value)::float8 * $4 + $5 as mean_value,
+        COUNT(*) as count
+    FROM climate_data
+    WHERE metric_id = $1
+        AND scenario_id = $2
+        AND year = $3
+        AND value IS NOT NULL
+"""
+
+CLIMATE_COLUMNAR_REGIONS_SQL = CLIMATE_COLUMNAR_SQL + "        AND region_id = ANY($6::int[])\n"
+
+# Placeholder rows have a NULL value; it is sent as NaN plus a flag so every
+# column stays fixed width, and mapped back to None by the endpoint.
+# asyncpg's copy_from_query does not bind arguments: it inlines them as quoted
+# literals (an extra round trip), and a None argument renders as nothing. The
+# region filter therefore lives in its own statement rather than a NULL check.
+BULK_CLIMATE_COPY_SQL = """
+    SELECT metric_id, scenario_id, region_id,
+           COALESCE(value::float8, 'NaN'::float8), value IS NULL
+    FROM climate_data
+    WHERE metric_id = ANY($1::int[])
+        AND scenario_id = ANY($2::int[])
+        AND year = $3
+"""
+
+BULK_CLIMATE_COPY_REGIONS_SQL = BULK_CLIMATE_COPY_SQL + "        AND region_id = ANY($4::int[])\n"
+
+# Binary COPY layout: a 19 byte header (signature, flags, extension length),
+# then per row an int16 field count and an int32 length before every field,
+# and a 2 byte trailer. With fixed width NOT NULL columns rows map onto a dtype.
+COPY_BINARY_HEADER_SIZE = 19
+COPY_BINARY_TRAILER_SIZE = 2
+BULK_COPY_ROW_DTYPE = np.dtype([
+    ('field_count', '>i2'),
+    ('metric_id_len', '>i4'), ('metric_id', '>i4'),
+    ('scenario_id_len', '>i4'), ('scenario_id', '>i4'),
+    ('region_id_len', '>i4'), ('region_id', '>i4'),
+    ('value_len', '>i4'), ('value', '>f8'),
+    ('value_is_null_len', '>i4'), ('value_is_null', '?'),
+])
+
+# The region identifier is an uncorrelated subquery, evaluated once per statement
+TIMESERIES_SQL = """
+    SELECT year, value,
+           (SELECT region_identifier FROM regions WHERE region_id = $3) as region_identifier
+    FROM climate_data
+    WHERE metric_id = $1
+        AND scenario_id = $2
+        AND region_id = $3
+        AND year BETWEEN $4 AND $5
+        AND value IS NOT NULL
+    ORDER BY year;
+"""
+
+# Cache lookup, computation on miss, and upsert of a multi-year average in one
+# round trip; $6 skips the lookup to force recomputation
+MULTI_YEAR_AVERAGE_SQL = """
+    WITH hit AS (
+        SELECT avg_value, data_points_count, computed_at, true AS cached
+        FROM climate_averages
+        WHERE NOT $6::boolean
+            AND region_id = $1
+            AND metric_id = $2
+            AND scenario_id = $3
+            AND start_year = $4
+            AND end_year = $5
+    ), miss AS (
+        SELECT AVG(value) AS avg_value, COUNT(*) AS data_points_count
+        FROM climate_data
+        WHERE NOT EXISTS (SELECT 1 FROM hit)
+            AND region_id = $1
+            AND metric_id = $2
+            AND scenario_id = $3
+            AND year BETWEEN $4 AND $5
+            AND value IS NOT NULL
+    ), stored AS (
+        INSERT INTO climate_averages
+            (region_id, metric_id, scenario_id, start_year, end_year,
+             avg_value, data_points_count, computed_at)
+        SELECT $1, $2, $3, $4, $5, avg_value, data_points_count, CURRENT_TIMESTAMP
+        FROM miss
+        WHERE data_points_count > 0
+        ON CONFLICT (region_id, metric_id, scenario_id, start_year, end_year)
+        DO UPDATE SET
+            avg_value = EXCLUDED.avg_value,
+            data_points_count = EXCLUDED.data_points_count,
+            computed_at = CURRENT_TIMESTAMP
+        RETURNING avg_value, data_points_count, computed_at, false AS cached
+    )
+    SELECT * FROM hit
+    UNION ALL
+    SELECT * FROM stored;
+"""
+
+# Per-region multi-year averages for a metric and scenario in one round trip:
+# cached rows are read, every other region with data is aggregated and upserted
+# as a set; the last parameter skips the lookup to force recomputation. There is
+# one constant statement per filter shape so both keep a usable generic plan: the
+# region variant takes the filter as $5 and shifts the recompute flag to $6
+_ALL_REGIONS_AVERAGE_TEMPLATE = """
+    WITH hit AS (
+        SELECT region_id, avg_value, data_points_count, true AS cached
+        FROM climate_averages
+        WHERE NOT ${force}::boolean
+            AND metric_id = $1
+            AND scenario_id = $2
+            AND start_year = $3
+            AND end_year = $4{hit_filter}
+    ), computed AS (
+        SELECT cd.region_id, AVG(cd.value) AS avg_value, COUNT(*)::int AS data_points_count,
+               false AS cached
+        FROM climate_data cd
+        WHERE cd.metric_id = $1
+            AND cd.scenario_id = $2
+            AND cd.year BETWEEN $3 AND $4
+            AND cd.value IS NOT NULL
+            AND NOT EXISTS (SELECT 1 FROM hit WHERE hit.region_id = cd.region_id){computed_filter}
+        GROUP BY cd.region_id
+    )
+    SELECT * FROM hit
+    UNION ALL
+    SELECT * FROM computed;
+"""
+
+ALL_REGIONS_AVERAGE_SQL = _ALL_REGIONS_AVERAGE_TEMPLATE.format(
+    force=5, hit_filter="", computed_filter=""
+)
+
+ALL_REGIONS_AVERAGE_REGIONS_SQL = _ALL_REGIONS_AVERAGE_TEMPLATE.format(
+    force=6,
+    hit_filter="\n            AND region_id = ANY($5::int[])",
+    # One-time filter: skip the aggregate when every requested region was a hit.
+    # $5 is deduplicated by canonical_region_ids, so its cardinality is exact.
+    computed_filter=(
+        "\n            AND cd.region_id = ANY($5::int[])"
+        "\n            AND (SELECT COUNT(*) FROM hit) < cardinality($5::int[])"
+    ),
+)
+
+# Stores the averages computed by ALL_REGIONS_AVERAGE_SQL, one array element per region
+STORE_AVERAGES_SQL = """
+    INSERT INTO climate_averages
+        (region_id, metric_id, scenario_id, start_year, end_year,
+         avg_value, data_points_count, computed_at)
+    SELECT t.region_id, $1, $2, $3, $4, t.avg_value, t.data_points_count, CURRENT_TIMESTAMP
+    FROM unnest($5::int[], $6::float8[], $7::int[]) AS t(region_id, avg_value, data_points_count)
+    ON CONFLICT (region_id, metric_id, scenario_id, start_year, end_year)
+    DO UPDATE SET
+        avg_value = EXCLUDED.avg_value,
+        data_points_count = EXCLUDED.data_points_count,
+        computed_at = CURRENT_TIMESTAMP;
+"""
+
+REGION_INFO_SQL = """
+    SELECT region_id, region_identifier, source_country_name,
+           source_admin_level, name_1, name_2
+    FROM regions
+    WHERE region_id = $1;
+"""
+
+REGION_ALL_SQL = """
+    SELECT metric_id, scenario_id, year, value
+    FROM climate_data
+    WHERE region_id = $1
+    ORDER BY metric_id, scenario_id, year;
+"""
+
+REGION_ALL_YEAR_SQL = """
+    SELECT metric_id, scenario_id, year, value
+    FROM climate_data
+    WHERE region_id = $1
+        AND year = $2
+    ORDER BY metric_id, scenario_id, year;
+"""
+
+REGION_CENTER_SQL = """
+    SELECT
+        ST_X(centroid) as longitude,
+        ST_Y(centroid) as latitude
+    FROM regions
+    WHERE region_id = $1;
+"""
 
 # Pydantic models
 class MetricInfo(BaseModel):
@@ -37,29 +311,6 @@ class ScenarioInfo(BaseModel):
     scenario_name: str
     description: str | None
 
-class ClimateDataPoint(BaseModel):
-    region_id: int
-    value: float
-    year: int | None = None
-
-class ClimateDataResponse(BaseModel):
-    metric: MetricInfo
-    scenario: ScenarioInfo
-    year: int
-    data: list[ClimateDataPoint]
-    summary: dict[str, float]
-
-class TimeSeriesPoint(BaseModel):
-    year: int
-    value: float
-
-class TimeSeriesResponse(BaseModel):
-    region_id: int
-    region_identifier: str | None
-    metric: MetricInfo
-    scenario: ScenarioInfo
-    data: list[TimeSeriesPoint]
-
 class YearRange(BaseModel):
     min_year: int
     max_year: int
@@ -85,7 +336,7 @@ class MultiYearAverageAllRegionsResponse(BaseModel):
     scenario: ScenarioInfo
     start_year: int
     end_year: int
-    data: list[MultiYearAverageDataPoint]
+    data: list[MultiYearAverageDataPoint] | dict[str, list[float]]
     summary: dict[str, float]
     cached_count: int
     computed_count: int
@@ -95,36 +346,184 @@ class RegionCenterResponse(BaseModel):
     longitude: float
     latitude: float
 
-# Database connection management
-@contextmanager
-def get_db_connection():
-    """Create a database connection context manager."""
-    conn = psycopg2.connect(**DATABASE_CONFIG)
-    try:
-        yield conn
-    finally:
-        conn.close()
+async def init_connection(conn):
+    """Decode NUMERIC columns as floats so rows serialize without Decimal handling."""
+    await conn.set_type_codec(
+        'numeric', encoder=str, decoder=float, schema='pg_catalog', format='text'
+    )
+
+# LRU cache for serialized responses, climate projections never change for a given request
+class ResponseCache:
+    def __init__(self, maxsize: int, max_bytes: int, max_entry_bytes: int):
+        self.maxsize = maxsize
+        self.max_bytes = max_bytes
+        self.max_entry_bytes = max_entry_bytes
+        self.total_bytes = 0
+        self.entries: OrderedDict[tuple, tuple[bytes, str]] = OrderedDict()
+
+    def get(self, key: tuple) -> tuple[bytes, str] | None:
+        """Return the cached (payload, etag) for key and mark it as most recently used."""
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def put(self, key: tuple, payload: bytes) -> tuple[bytes, str]:
+        """
+        Store a payload with its ETag, evicting least recently used entries until both
+        the entry count and the byte budget fit. Payloads above max_entry_bytes are
+        not stored. Returns the (payload, etag) entry either way.
+        """
+        entry = (payload, f'"{hashlib.blake2b(payload, digest_size=16).hexdigest()}"')
+        if len(payload) > self.max_entry_bytes:
+            return entry
+
+        previous = self.entries.pop(key, None)
+        if previous is not None:
+            self.total_bytes -= len(previous[0])
+        self.entries[key] = entry
+        self.total_bytes += len(payload)
+        while len(self.entries) > self.maxsize or self.total_bytes > self.max_bytes:
+            _, (evicted, _) = self.entries.popitem(last=False)
+            self.total_bytes -= len(evicted)
+        return entry
+
+    def clear(self):
+        """Drop all cached payloads."""
+        self.entries.clear()
+        self.total_bytes = 0
+
+response_cache = ResponseCache(
+    RESPONSE_CACHE_SIZE, RESPONSE_CACHE_MAX_BYTES, RESPONSE_CACHE_MAX_ENTRY_BYTES
+)
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """
+    Evaluate an If-None-Match header against an ETag (RFC 9110 section 13.1.2).
+    The header may list several entity tags or be "*"; comparison is weak, so a
+    W/ prefix on either side is ignored.
+    """
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    etag = etag.removeprefix("W/")
+    return any(
+        tag.strip().removeprefix("W/") == etag
+        for tag in if_none_match.split(",")
+    )
+
+def cached_json_response(request: Request, entry: tuple[bytes, str]) -> Response:
+    """
+    Build a response for a cached (payload, etag) entry with HTTP caching headers.
+    Answers 304 Not Modified without a body when the client already has this payload.
+    """
+    payload, etag = entry
+    headers = {"ETag": etag, "Cache-Control": HTTP_CACHE_CONTROL}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=payload, media_type="application/json", headers=headers)
+
+# LRU cache with expiry for rows that other workers or the seed scripts may rewrite
+class TTLCache:
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.entries: OrderedDict[tuple, tuple[float, object]] = OrderedDict()
+
+    def get(self, key: tuple):
+        """Return the cached value for key, or None if it is missing or expired."""
+        entry = self.entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self.entries[key]
+            return None
+        self.entries.move_to_end(key)
+        return value
+
+    def put(self, key: tuple, value):
+        """Store a value, evicting the least recently used entry when full."""
+        self.entries[key] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end(key)
+        if len(self.entries) > self.maxsize:
+            self.entries.popitem(last=False)
+
+    def pop(self, key: tuple):
+        """Drop the entry for key if present."""
+        self.entries.pop(key, None)
+
+average_cache = TTLCache(AVERAGE_CACHE_SIZE, AVERAGE_CACHE_TTL)
+region_center_cache = TTLCache(REGION_CENTER_CACHE_SIZE, REGION_CENTER_CACHE_TTL)
 
 # Cache for reference data
 class ReferenceDataCache:
     def __init__(self):
         self.metrics = {}
         self.scenarios = {}
+        self.metric_ids = {}
+        self.scenario_ids = {}
+        self.metric_codes = {}
+        self.scenario_codes = {}
+        self.metric_infos: dict[str, MetricInfo] = {}
+        self.scenario_infos: dict[str, ScenarioInfo] = {}
+        self.unit_converters = {}
+        self.metrics_json = b"[]"
+        self.scenarios_json = b"[]"
         self.last_refresh = None
-        
-    def refresh(self):
-        """Refresh the cache from database."""
-        with get_db_connection() as conn:
-            with conn.cursor(cursor_factory=RealDictCursor) as cur:
-                # Load metrics
-                cur.execute("SELECT * FROM metrics ORDER BY metric_code;")
-                self.metrics = {row['metric_code']: dict(row) for row in cur.fetchall()}
-                
-                # Load scenarios
-                cur.execute("SELECT * FROM scenarios ORDER BY scenario_code;")
-                self.scenarios = {row['scenario_code']: dict(row) for row in cur.fetchall()}
-                
-                self.last_refresh = datetime.now()
+
+    async def refresh(self, pool: asyncpg.Pool):
+        """
+        Refresh the cache from database.
+        Everything is built locally and published in a single assignment, so
+        handlers never observe a mix of old and new reference data.
+        """
+        # Load metrics and scenarios concurrently on separate pooled connections
+        metric_rows, scenario_rows = await asyncio.gather(
+            pool.fetch("SELECT * FROM metrics ORDER BY metric_code;"),
+            pool.fetch("SELECT * FROM scenarios ORDER BY scenario_code;")
+        )
+        metrics = {row['metric_code']: dict(row) for row in metric_rows}
+        scenarios = {row['scenario_code']: dict(row) for row in scenario_rows}
+
+        # Cached responses embed metric and scenario info
+        if metrics != self.metrics or scenarios != self.scenarios:
+            response_cache.clear()
+
+        metric_ids = {row['metric_code']: row['id'] for row in metric_rows}
+        metric_codes = {row['id']: row['metric_code'] for row in metric_rows}
+        unit_converters = {row['unit']: derive_unit_conversion(row['unit']) for row in metric_rows}
+        scenario_ids = {row['scenario_code']: row['id'] for row in scenario_rows}
+        scenario_codes = {row['id']: row['scenario_code'] for row in scenario_rows}
+
+        # Validated models are built once per refresh instead of once per request
+        metric_infos = {code: MetricInfo(**metric) for code, metric in metrics.items()}
+        scenario_infos = {code: ScenarioInfo(**scenario) for code, scenario in scenarios.items()}
+
+        # Serialize the reference data endpoints once per refresh
+        metrics_json = orjson.dumps(list(metrics.values()))
+        scenarios_json = orjson.dumps(list(scenarios.values()))
+
+        (self.metrics, self.metric_ids, self.metric_codes, self.metric_infos, self.metrics_json,
+         self.scenarios, self.scenario_ids, self.scenario_codes, self.scenario_infos,
+         self.scenarios_json, self.unit_converters, self.last_refresh) = (
+            metrics, metric_ids, metric_codes, metric_infos, metrics_json,
+            scenarios, scenario_ids, scenario_codes, scenario_infos,
+            scenarios_json, unit_converters, datetime.now()
+        )
+
+    async def refresh_periodically(self, pool: asyncpg.Pool):
+        """Refresh the cache every REFERENCE_CACHE_REFRESH_INTERVAL seconds until cancelled."""
+        while True:
+            await asyncio.sleep(REFERENCE_CACHE_REFRESH_INTERVAL)
+            try:
+                await self.refresh(pool)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                # Any failure keeps the previous snapshot; the loop must survive to retry
+                print(f"⚠️  Reference data refresh failed: {e!r}. Keeping cached data")
 
 # Initialize cache
 cache = ReferenceDataCache()
@@ -132,34 +531,57 @@ cache = ReferenceDataCache()
 # Lifespan event handler
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    """Initialize cache on startup and cleanup on shutdown."""
+    """Create the connection pool and initialize cache on startup, close the pool on shutdown."""
     # Startup - retry database connection with exponential backoff
     max_retries = 10
     retry_delay = 2
+    pool = None
 
-    for attempt in range(max_retries):
-        try:
-            print(f"🔄 Attempting to initialize cache (attempt {attempt + 1}/{max_retries})...")
-            cache.refresh()
-            print("✅ Reference data cache initialized")
-            break
-        except psycopg2.OperationalError as e:
-            if attempt < max_retries - 1:
-                print(f"⚠️  Database not ready: {e}. Retrying in {retry_delay} seconds...")
-                await asyncio.sleep(retry_delay)
-                retry_delay = int(min(retry_delay * 1.5, 30))  # Exponential backoff, max 30s
-            else:
-                print(f"❌ Failed to connect to database after {max_retries} attempts")
-                raise
-
+    try:
+        for attempt in range(max_retries):
+            try:
+                print(f"🔄 Attempting to initialize cache (attempt {attempt + 1}/{max_retries})...")
+                if pool is None:
+                    pool = await asyncpg.create_pool(
+                        **DATABASE_CONFIG,
+                        min_size=POOL_MIN_SIZE,
+                        max_size=POOL_MAX_SIZE,
+                        max_inactive_connection_lifetime=POOL_MAX_INACTIVE_LIFETIME,
+                        statement_cache_size=STATEMENT_CACHE_SIZE,
+                        init=init_connection
+                    )
+                await cache.refresh(pool)
+                print("✅ Reference data cache initialized")
+                break
+            except (OSError, asyncpg.PostgresError) as e:
+                if attempt < max_retries - 1:
+                    print(f"⚠️  Database not ready: {e}. Retrying in {retry_delay} seconds...")
+                    await asyncio.sleep(retry_delay)
+                    retry_delay = int(min(retry_delay * 1.5, 30))  # Exponential backoff, max 30s
+                else:
+                    print(f"❌ Failed to connect to database after {max_retries} attempts")
+                    raise
+    except BaseException:
+        # Don't leave the pool's connections open when startup is abandoned
+        if pool is not None:
+            await pool.close()
+        raise
+
+    app.state.pool = pool
+    refresh_task = asyncio.create_task(cache.refresh_periodically(pool))
     yield
-    # Shutdown (if needed in the future)
+    # Shutdown
+    refresh_task.cancel()
+    with suppress(asyncio.CancelledError):
+        await refresh_task
+    await pool.close()
 
 # Initialize FastAPI app
 app = FastAPI(
     title="CMIP6 Atlas Climate Data API",
     description="API for retrieving climate projection data from CMIP6 models",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
@@ -173,179 +595,196 @@ app.add_middleware(
 )
 
 # Unit conversion functions
-def celsius_to_fahrenheit(celsius: float) -> float:
-    """Convert Celsius to Fahrenheit."""
-    return (float(celsius) * 9/5) + 32
-
-def mm_to_inches(mm: float) -> float:
-    """Convert millimeters to inches."""
-    return float(mm) / 25.4
-
-def convert_to_american_units(value: float, unit: str | None) -> tuple[float, str | None]:
+def derive_unit_conversion(unit: str | None) -> tuple[float, float, str | None]:
     """
-    Convert a value to American units if applicable.
-    Returns tuple of (converted_value, new_unit).
+    Derive the linear conversion from a metric unit to American units.
+    Returns tuple of (scale, offset, new_unit) such that converted = value * scale + offset.
     """
     if not unit:
-        return value, unit
+        return 1.0, 0.0, unit
 
     unit_lower = unit.lower()
 
     # Temperature conversions
     if 'celsius' in unit_lower or unit_lower == '°c' or unit_lower == 'c':
-        return celsius_to_fahrenheit(value), unit.replace('Celsius', 'Fahrenheit').replace('°C', '°F').replace('C', 'F')
+        return 9/5, 32.0, unit.replace('Celsius', 'Fahrenheit').replace('°C', '°F').replace('C', 'F')
 
     # Precipitation/length conversions
     if unit_lower == 'mm' or 'millimeter' in unit_lower:
-        return mm_to_inches(value), unit.replace('mm', 'inches').replace('millimeter', 'inch')
+        return 1/25.4, 0.0, unit.replace('mm', 'inches').replace('millimeter', 'inch')
 
     # No conversion needed
-    return value, unit
+    return 1.0, 0.0, unit
 
-# Helper functions for multi-year averaging
-def get_metric_and_scenario_ids(metric_code: str, scenario_code: str) -> tuple[int, int]:
+def apply_unit_conversion(values: np.ndarray, scale: float, offset: float) -> np.ndarray:
     """
-    Look up metric_id and scenario_id from their codes.
-    Raises HTTPException if not found.
+    Apply a linear unit conversion to a float64 array in place.
+    Identity steps are skipped, so unconvertible units cost nothing.
     """
-    if metric_code not in cache.metrics:
-        raise HTTPException(status_code=404, detail=f"Metric '{metric_code}' not found")
+    if scale != 1.0:
+        np.multiply(values, scale, out=values)
+    if offset != 0.0:
+        np.add(values, offset, out=values)
+    return values
 
-    if scenario_code not in cache.scenarios:
-        raise HTTPException(status_code=404, detail=f"Scenario '{scenario_code}' not found")
+def convert_to_american_units(value: float, unit: str | None) -> tuple[float, str | None]:
+    """
+    Convert a value to American units if applicable.
+    Returns tuple of (converted_value, new_unit).
+    """
+    scale, offset, new_unit = cache.unit_converters[unit]
+    return float(value) * scale + offset, new_unit
 
-    metric_id = cache.metrics[metric_code]['id']
-    scenario_id = cache.scenarios[scenario_code]['id']
+def canonical_region_ids(region_ids: list[int] | None) -> list[int] | None:
+    """
+    Deduplicate and sort a region filter so equivalent filters bind identical
+    parameters and share response cache entries. Returns None for no filter.
+    """
+    if not region_ids:
+        return None
+    return sorted(set(region_ids))
 
-    return metric_id, scenario_id
+# Helper functions for binary COPY
+async def copy_binary_rows(conn, query: str, dtype: np.dtype, *args) -> np.ndarray:
+    """
+    Run a query through COPY ... TO STDOUT (FORMAT binary) and view the rows as a structured array.
+    All selected columns must be fixed width and NOT NULL so each row matches dtype exactly.
+    args are inlined into the query by asyncpg as literals and must not be None.
+    """
+    chunks = []
 
-def get_cached_average(cur, region_id: int, metric_id: int, scenario_id: int,
-                       start_year: int, end_year: int) -> dict | None:
+    async def collect(chunk):
+        chunks.append(chunk)
+
+    await conn.copy_from_query(query, *args, output=collect, format='binary')
+    buffer = b"".join(chunks)
+    count = (len(buffer) - COPY_BINARY_HEADER_SIZE - COPY_BINARY_TRAILER_SIZE) // dtype.itemsize
+    return np.frombuffer(buffer, dtype=dtype, count=count, offset=COPY_BINARY_HEADER_SIZE)
+
+# Helper functions for single-year climate data
+async def fetch_climate_rows(metric_id: int, scenario_id: int, year: int,
+                             region_ids: list[int] | None, sort: bool) -> list:
     """
-    Check if a cached average exists in the climate_averages table.
-    Returns the cached record or None if not found.
+    Fetch (region_id, value) rows for a metric, scenario, and year.
+    Uses the prepared statement variant matching the region filter and sort order.
     """
-    cur.execute("""
-        SELECT
-            avg_value,
-            data_points_count,
-            computed_at
-        FROM climate_averages
-        WHERE region_id = %s
-            AND metric_id = %s
-            AND scenario_id = %s
-            AND start_year = %s
-            AND end_year = %s;
-    """, (region_id, metric_id, scenario_id, start_year, end_year))
-
-    result = cur.fetchone()
-    return dict(result) if result else None
-
-def compute_average(cur, region_id: int, metric_id: int, scenario_id: int,
-                   start_year: int, end_year: int) -> tuple[float, int] | None:
-    """
-    Compute the average value from the climate_data table.
-    Returns (avg_value, data_points_count) or None if no data exists.
-    """
-    cur.execute("""
-        WITH yearly_data AS (
-            SELECT
-                cd.year,
-                cd.value
-            FROM climate_data cd
-            WHERE cd.region_id = %s
-                AND cd.metric_id = %s
-                AND cd.scenario_id = %s
-                AND cd.year BETWEEN %s AND %s
-                AND cd.value IS NOT NULL
+    async with app.state.pool.acquire() as conn:
+        if region_ids:
+            query = CLIMATE_BY_YEAR_REGIONS_SORTED_SQL if sort else CLIMATE_BY_YEAR_REGIONS_SQL
+            return await conn.fetch(query, metric_id, scenario_id, year, region_ids)
+        query = CLIMATE_BY_YEAR_SORTED_SQL if sort else CLIMATE_BY_YEAR_SQL
+        return await conn.fetch(query, metric_id, scenario_id, year)
+
+async def fetch_climate_summary(metric_id: int, scenario_id: int, year: int,
+                                region_ids: list[int] | None):
+    """
+    Compute min, max, mean, and count for a metric, scenario, and year in the database.
+    Runs on its own pooled connection so it can overlap with fetch_climate_rows.
+    """
+    async with app.state.pool.acquire() as conn:
+        if region_ids:
+            return await conn.fetchrow(
+                CLIMATE_SUMMARY_REGIONS_SQL, metric_id, scenario_id, year, region_ids
+            )
+        return await conn.fetchrow(CLIMATE_SUMMARY_SQL, metric_id, scenario_id, year)
+
+async def fetch_climate_columnar(metric_id: int, scenario_id: int, year: int,
+                                 region_ids: list[int] | None, scale: float, offset: float):
+    """
+    Fetch columnar JSON data and summary statistics for a metric, scenario, and year
+    in one round trip. Values and statistics are converted with scale and offset.
+    """
+    if region_ids:
+        return await app.state.pool.fetchrow(
+            CLIMATE_COLUMNAR_REGIONS_SQL, metric_id, scenario_id, year, scale, offset, region_ids
         )
-        SELECT
-            AVG(value) as avg_value,
-            COUNT(*) as data_points_count
-        FROM yearly_data;
-    """, (region_id, metric_id, scenario_id, start_year, end_year))
+    return await app.state.pool.fetchrow(
+        CLIMATE_COLUMNAR_SQL, metric_id, scenario_id, year, scale, offset
+    )
 
-    result = cur.fetchone()
+# Helper functions for region data
+async def fetch_region_climate_data(region_id: int, year: int | None) -> dict:
+    """
+    Stream all climate data for a region and organize it by metric and scenario.
+    Runs on its own pooled connection so it can overlap with the region lookup.
+    """
+    organized_data = {}
+    # Rows carry ids only; codes and names come from the reference data cache
+    metrics, metric_codes = cache.metrics, cache.metric_codes
+    scenarios, scenario_codes = cache.scenarios, cache.scenario_codes
+    async with app.state.pool.acquire() as conn:
+        async with conn.transaction():
+            # Rows are organized as they arrive instead of materializing the full result set.
+            # They are ordered by (metric_id, scenario_id), so the target list only has to be
+            # resolved when that pair changes rather than once per row.
+            current_key = None
+            data = None
+            # One constant statement per filter shape, so both keep a usable generic plan
+            if year:
+                cursor = conn.cursor(REGION_ALL_YEAR_SQL, region_id, year, prefetch=CURSOR_PREFETCH)
+            else:
+                cursor = conn.cursor(REGION_ALL_SQL, region_id, prefetch=CURSOR_PREFETCH)
+            async for metric_id, scenario_id, row_year, value in cursor:
+                if (metric_id, scenario_id) != current_key:
+                    current_key = (metric_id, scenario_id)
+                    metric_key = metric_codes.get(metric_id)
+                    scenario_key = scenario_codes.get(scenario_id)
+                    if metric_key is None or scenario_key is None:
+                        # Added since the last cache refresh
+                        data = None
+                        continue
 
-    if result and result['avg_value'] is not None and result['data_points_count'] > 0:
-        return float(result['avg_value']), int(result['data_points_count'])
+                    if metric_key not in organized_data:
+                        organized_data[metric_key] = {
+                            "metric_name": metrics[metric_key]['metric_name'],
+                            "unit": metrics[metric_key]['unit'],
+                            "scenarios": {}
+                        }
 
-    return None
+                    data = []
+                    organized_data[metric_key]["scenarios"][scenario_key] = {
+                        "scenario_name": scenarios[scenario_key]['scenario_name'],
+                        "data": data
+                    }
+                elif data is None:
+                    continue
 
-def store_computed_average(cur, conn, region_id: int, metric_id: int, scenario_id: int,
-                          start_year: int, end_year: int, avg_value: float,
-                          data_points_count: int):
+                data.append({
+                    "year": row_year,
+                    "value": value
+                })
+    return organized_data
+
+# Helper functions for multi-year averaging
+async def persist_averages(metric_id: int, scenario_id: int, start_year: int, end_year: int,
+                           region_ids: list[int], avg_values: list[float],
+                           data_points_counts: list[int]) -> None:
     """
-    Store the computed average in the climate_averages table.
+    Store computed region averages in climate_averages.
+    Runs as a background task after the response has been sent.
     """
-    cur.execute("""
-        INSERT INTO climate_averages
-            (region_id, metric_id, scenario_id, start_year, end_year,
-             avg_value, data_points_count, computed_at)
-        VALUES (%s, %s, %s, %s, %s, %s, %s, CURRENT_TIMESTAMP)
-        ON CONFLICT (region_id, metric_id, scenario_id, start_year, end_year)
-        DO UPDATE SET
-            avg_value = EXCLUDED.avg_value,
-            data_points_count = EXCLUDED.data_points_count,
-            computed_at = CURRENT_TIMESTAMP;
-    """, (region_id, metric_id, scenario_id, start_year, end_year,
-          avg_value, data_points_count))
-    conn.commit()
-
-def get_all_cached_averages(cur, metric_id: int, scenario_id: int,
-                            start_year: int, end_year: int) -> dict[int, dict]:
-    """
-    Get all cached averages for all regions for the specified parameters.
-    Returns a dictionary mapping region_id to cached data.
-    """
-    cur.execute("""
-        SELECT
-            region_id,
-            avg_value,
-            data_points_count,
-            computed_at
-        FROM climate_averages
-        WHERE metric_id = %s
-            AND scenario_id = %s
-            AND start_year = %s
-            AND end_year = %s;
-    """, (metric_id, scenario_id, start_year, end_year))
-
-    results = cur.fetchall()
-    return {row['region_id']: dict(row) for row in results}
-
-def compute_all_averages(cur, metric_id: int, scenario_id: int,
-                        start_year: int, end_year: int) -> dict[int, tuple[float, int]]:
-    """
-    Compute averages for all regions in a single query.
-    Returns a dictionary mapping region_id to (avg_value, data_points_count).
-    """
-    cur.execute("""
-        WITH yearly_data AS (
-            SELECT
-                cd.region_id,
-                cd.year,
-                cd.value
-            FROM climate_data cd
-            WHERE cd.metric_id = %s
-                AND cd.scenario_id = %s
-                AND cd.year BETWEEN %s AND %s
-                AND cd.value IS NOT NULL
+    try:
+        await app.state.pool.execute(
+            STORE_AVERAGES_SQL, metric_id, scenario_id, start_year, end_year,
+            region_ids, avg_values, data_points_counts
         )
-        SELECT
-            region_id,
-            AVG(value) as avg_value,
-            COUNT(*) as data_points_count
-        FROM yearly_data
-        GROUP BY region_id
-        HAVING COUNT(*) > 0;
-    """, (metric_id, scenario_id, start_year, end_year))
-
-    results = cur.fetchall()
-    return {
-        row['region_id']: (float(row['avg_value']), int(row['data_points_count']))
-        for row in results
-    }
+    except (OSError, asyncpg.PostgresError) as e:
+        print(f"⚠️  Failed to store computed averages: {e}")
+
+def get_metric_and_scenario_ids(metric_code: str, scenario_code: str) -> tuple[int, int]:
+    """
+    Look up metric_id and scenario_id from their codes.
+    Raises HTTPException if not found.
+    """
+    metric_id = cache.metric_ids.get(metric_code)
+    if metric_id is None:
+        raise HTTPException(status_code=404, detail=f"Metric '{metric_code}' not found")
+
+    scenario_id = cache.scenario_ids.get(scenario_code)
+    if scenario_id is None:
+        raise HTTPException(status_code=404, detail=f"Scenario '{scenario_code}' not found")
+
+    return metric_id, scenario_id
 
 # API Endpoints
 
@@ -361,127 +800,143 @@ async def root():
 @app.get("/metrics", response_model=list[MetricInfo], tags=["Reference Data"])
 async def get_metrics():
     """Get all available climate metrics."""
-    if not cache.metrics:
-        cache.refresh()
-    return list(cache.metrics.values())
+    return Response(content=cache.metrics_json, media_type="application/json")
 
 @app.get("/scenarios", response_model=list[ScenarioInfo], tags=["Reference Data"])
 async def get_scenarios():
     """Get all available climate scenarios."""
-    if not cache.scenarios:
-        cache.refresh()
-    return list(cache.scenarios.values())
+    return Response(content=cache.scenarios_json, media_type="application/json")
 
 @app.get("/years/{metric_code}/{scenario_code}", response_model=YearRange, tags=["Reference Data"])
 async def get_available_years(metric_code: str, scenario_code: str):
     """Get the range of years available for a specific metric and scenario."""
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cur.execute("""
-                SELECT MIN(cd.year) as min_year, MAX(cd.year) as max_year
-                FROM climate_data cd
-                JOIN metrics m ON cd.metric_id = m.id
-                JOIN scenarios s ON cd.scenario_id = s.id
-                WHERE m.metric_code = %s AND s.scenario_code = %s;
-            """, (metric_code, scenario_code))
-            
-            result = cur.fetchone()
-            if not result or result['min_year'] is None:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No data found for metric '{metric_code}' and scenario '{scenario_code}'"
-                )
-            
-            return YearRange(min_year=result['min_year'], max_year=result['max_year'])
+    metric_id, scenario_id = get_metric_and_scenario_ids(metric_code, scenario_code)
+
+    async with app.state.pool.acquire() as conn:
+        result = await conn.fetchrow(YEARS_RANGE_SQL, metric_id, scenario_id)
+
+        if not result or result['min_year'] is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No data found for metric '{metric_code}' and scenario '{scenario_code}'"
+            )
+
+        return YearRange(min_year=result['min_year'], max_year=result['max_year'])
 
 @app.get("/climate/{metric_code}/{scenario_code}/{year}",
-         response_model=ClimateDataResponse,
          tags=["Climate Data"])
 async def get_climate_data(
+    request: Request,
     metric_code: str,
     scenario_code: str,
     year: int,
     region_ids: list[int] | None = Query(None, description="Filter by specific region IDs"),
     include_summary: bool = Query(True, description="Include statistical summary"),
-    american: bool = Query(False, description="Convert values to American units (Fahrenheit, inches)")
+    american: bool = Query(False, description="Convert values to American units (Fahrenheit, inches)"),
+    sort: bool = Query(False, alias="sorted", description="Order data points by region_id"),
+    columnar: bool = Query(False, description="Return data as parallel region_id and value arrays")
 ):
     """
     Get climate data for a specific metric, scenario, and year.
 
     This endpoint returns data for all regions (or filtered regions) that can be
-    joined client-side with the geometry tiles for visualization.
+    joined client-side with the geometry tiles for visualization. With columnar=true,
+    data is {"region_id": [...], "value": [...]} ordered by region_id instead of one
+    object per region, and is assembled by the database together with the summary.
     """
-    if metric_code not in cache.metrics:
-        raise HTTPException(status_code=404, detail=f"Metric '{metric_code}' not found")
-    
-    if scenario_code not in cache.scenarios:
-        raise HTTPException(status_code=404, detail=f"Scenario '{scenario_code}' not found")
-    
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # Build query
-            query = """
-                SELECT cd.region_id, cd.value
-                FROM climate_data cd
-                JOIN metrics m ON cd.metric_id = m.id
-                JOIN scenarios s ON cd.scenario_id = s.id
-                WHERE m.metric_code = %s 
-                    AND s.scenario_code = %s 
-                    AND cd.year = %s
-            """
-            params = [metric_code, scenario_code, year]
-            
-            # Add region filter if provided
-            if region_ids:
-                query += " AND cd.region_id = ANY(%s)"
-                params.append(region_ids)
-            
-            query += " ORDER BY cd.region_id;"
-            
-            cur.execute(query, params)
-            results = cur.fetchall()
-            
-            if not results:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No data found for {metric_code}/{scenario_code}/{year}"
-                )
-
-            # Get metric info and determine unit conversion
-            metric_info = MetricInfo(**cache.metrics[metric_code])
-            converted_unit = metric_info.unit
-
-            # Prepare response with unit conversion if requested
-            data_points = []
-            for row in results:
-                value = row['value']
-                if american:
-                    value, converted_unit = convert_to_american_units(value, metric_info.unit)
-                data_points.append(ClimateDataPoint(region_id=row['region_id'], value=value))
-
-            # Update metric info with converted unit
-            if american:
-                metric_info.unit = converted_unit
-
-            # Calculate summary statistics
-            summary = {}
-            if include_summary and data_points:
-                values = [dp.value for dp in data_points]
-                summary = {
-                    "min": min(values),
-                    "max": max(values),
-                    "mean": sum(values) / len(values),
-                    "count": len(values)
-                }
-
-            return ClimateDataResponse(
-                metric=metric_info,
-                scenario=ScenarioInfo(**cache.scenarios[scenario_code]),
-                year=year,
-                data=data_points,
-                summary=summary
+    metric_id, scenario_id = get_metric_and_scenario_ids(metric_code, scenario_code)
+    region_ids = canonical_region_ids(region_ids)
+
+    cache_key = (
+        "climate", metric_code, scenario_code, year,
+        tuple(region_ids or ()), include_summary, american, sort, columnar
+    )
+    entry = response_cache.get(cache_key)
+    if entry is not None:
+        return cached_json_response(request, entry)
+
+    metric = cache.metrics[metric_code]
+    if columnar:
+        scale, offset, unit = cache.unit_converters[metric['unit']] if american else (1.0, 0.0, None)
+        result = await fetch_climate_columnar(metric_id, scenario_id, year, region_ids, scale, offset)
+        if not result['count']:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No data found for {metric_code}/{scenario_code}/{year}"
             )
 
+        summary = {}
+        if include_summary:
+            summary = {
+                "min": result['min_value'],
+                "max": result['max_value'],
+                "mean": result['mean_value'],
+                "count": result['count']
+            }
+
+        # The data arrays are already JSON and are embedded without re-parsing
+        payload = orjson.dumps({
+            "metric": {**metric, 'unit': unit} if american else metric,
+            "scenario": cache.scenarios[scenario_code],
+            "year": year,
+            "data": orjson.Fragment(result['data']),
+            "summary": summary
+        })
+        return cached_json_response(request, response_cache.put(cache_key, payload))
+
+    # Summary statistics are aggregated by the database while the rows are fetched
+    summary_row = None
+    if include_summary:
+        results, summary_row = await asyncio.gather(
+            fetch_climate_rows(metric_id, scenario_id, year, region_ids, sort),
+            fetch_climate_summary(metric_id, scenario_id, year, region_ids)
+        )
+    else:
+        results = await fetch_climate_rows(metric_id, scenario_id, year, region_ids, sort)
+
+    if not results:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No data found for {metric_code}/{scenario_code}/{year}"
+        )
+
+    summary = {}
+    if summary_row is not None:
+        summary = {
+            "min": summary_row['min_value'],
+            "max": summary_row['max_value'],
+            "mean": summary_row['mean_value'],
+            "count": summary_row['count']
+        }
+
+    # Apply unit conversion to all values at once if requested
+    if american:
+        scale, offset, unit = cache.unit_converters[metric['unit']]
+        metric = {**metric, 'unit': unit}
+        values = np.fromiter((row[1] for row in results), dtype=np.float64, count=len(results))
+        apply_unit_conversion(values, scale, offset)
+        # Conversions are linear, so converted aggregates equal aggregates of converted values
+        for key in ("min", "max", "mean"):
+            if key in summary:
+                summary[key] = summary[key] * scale + offset
+        data = [
+            {"region_id": row[0], "value": value}
+            for row, value in zip(results, values.tolist())
+        ]
+    else:
+        # Values are already floats from the connection codec, so no array round trip is needed
+        data = [{"region_id": region_id, "value": value} for region_id, value in results]
+
+    # Plain dicts are serialized by orjson without per-row model validation
+    payload = orjson.dumps({
+        "metric": metric,
+        "scenario": cache.scenarios[scenario_code],
+        "year": year,
+        "data": data,
+        "summary": summary
+    })
+    return cached_json_response(request, response_cache.put(cache_key, payload))
+
 @app.get("/climate/bulk/{year}",
          tags=["Climate Data"])
 async def get_bulk_climate_data(
@@ -495,50 +950,45 @@ async def get_bulk_climate_data(
     Useful for creating comparison views or dashboards.
     """
     results = {}
-    
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            for metric_code in metrics:
-                if metric_code not in cache.metrics:
-                    continue
-                    
-                for scenario_code in scenarios:
-                    if scenario_code not in cache.scenarios:
-                        continue
-                    
-                    query = """
-                        SELECT cd.region_id, cd.value
-                        FROM climate_data cd
-                        JOIN metrics m ON cd.metric_id = m.id
-                        JOIN scenarios s ON cd.scenario_id = s.id
-                        WHERE m.metric_code = %s 
-                            AND s.scenario_code = %s 
-                            AND cd.year = %s
-                    """
-                    params = [metric_code, scenario_code, year]
-                    
-                    if region_ids:
-                        query += " AND cd.region_id = ANY(%s)"
-                        params.append(region_ids)
-                    
-                    cur.execute(query, params)
-                    data = cur.fetchall()
-                    
-                    if data:
-                        key = f"{metric_code}_{scenario_code}"
-                        results[key] = {
-                            "metric": cache.metrics[metric_code],
-                            "scenario": cache.scenarios[scenario_code],
-                            "year": year,
-                            "data": {row['region_id']: row['value'] for row in data}
-                        }
-    
+    region_ids = canonical_region_ids(region_ids)
+
+    # Unknown codes are skipped rather than sent to the database
+    metric_codes = {cache.metric_ids[code]: code for code in metrics if code in cache.metric_ids}
+    scenario_codes = {cache.scenario_ids[code]: code for code in scenarios if code in cache.scenario_ids}
+    if not metric_codes or not scenario_codes:
+        return results
+
+    # Fetch every metric/scenario combination from a single query as typed binary rows
+    args = [list(metric_codes), list(scenario_codes), year]
+    query = BULK_CLIMATE_COPY_SQL
+    if region_ids:
+        query = BULK_CLIMATE_COPY_REGIONS_SQL
+        args.append(region_ids)
+    async with app.state.pool.acquire() as conn:
+        rows = await copy_binary_rows(conn, query, BULK_COPY_ROW_DTYPE, *args)
+
+    for metric_id, metric_code in metric_codes.items():
+        metric_mask = rows['metric_id'] == metric_id
+        for scenario_id, scenario_code in scenario_codes.items():
+            pair_rows = rows[metric_mask & (rows['scenario_id'] == scenario_id)]
+            if not len(pair_rows):
+                continue
+            values = pair_rows['value'].tolist()
+            for index in np.flatnonzero(pair_rows['value_is_null']).tolist():
+                values[index] = None
+            results[f"{metric_code}_{scenario_code}"] = {
+                "metric": cache.metrics[metric_code],
+                "scenario": cache.scenarios[scenario_code],
+                "year": year,
+                "data": dict(zip(pair_rows['region_id'].tolist(), values))
+            }
+
     return results
 
 @app.get("/timeseries/{metric_code}/{scenario_code}/{region_id}",
-         response_model=TimeSeriesResponse,
          tags=["Time Series"])
 async def get_timeseries(
+    request: Request,
     metric_code: str,
     scenario_code: str,
     region_id: int,
@@ -550,73 +1000,49 @@ async def get_timeseries(
     Get time series data for a specific region, metric, and scenario.
     Useful for displaying temporal trends in charts.
     """
-    if metric_code not in cache.metrics:
-        raise HTTPException(status_code=404, detail=f"Metric '{metric_code}' not found")
-    
-    if scenario_code not in cache.scenarios:
-        raise HTTPException(status_code=404, detail=f"Scenario '{scenario_code}' not found")
-    
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # Get region identifier
-            cur.execute("SELECT region_identifier FROM regions WHERE region_id = %s;", (region_id,))
-            region_result = cur.fetchone()
-            region_identifier = region_result['region_identifier'] if region_result else None
-            
-            # Build time series query
-            query = """
-                SELECT cd.year, cd.value
-                FROM climate_data cd
-                JOIN metrics m ON cd.metric_id = m.id
-                JOIN scenarios s ON cd.scenario_id = s.id
-                WHERE m.metric_code = %s 
-                    AND s.scenario_code = %s 
-                    AND cd.region_id = %s
-            """
-            params = [metric_code, scenario_code, region_id]
-            
-            if start_year:
-                query += " AND cd.year >= %s"
-                params.append(start_year)
-            
-            if end_year:
-                query += " AND cd.year <= %s"
-                params.append(end_year)
-            
-            query += " ORDER BY cd.year;"
-            
-            cur.execute(query, params)
-            results = cur.fetchall()
-
-            if not results:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No time series data found for region {region_id}"
-                )
-
-            # Get metric info and determine unit conversion
-            metric_info = MetricInfo(**cache.metrics[metric_code])
-            converted_unit = metric_info.unit
-
-            # Prepare time series data with unit conversion if requested
-            time_series_data = []
-            for row in results:
-                value = row['value']
-                if american:
-                    value, converted_unit = convert_to_american_units(value, metric_info.unit)
-                time_series_data.append(TimeSeriesPoint(year=row['year'], value=value))
-
-            # Update metric info with converted unit
-            if american:
-                metric_info.unit = converted_unit
-
-            return TimeSeriesResponse(
-                region_id=region_id,
-                region_identifier=region_identifier,
-                metric=metric_info,
-                scenario=ScenarioInfo(**cache.scenarios[scenario_code]),
-                data=time_series_data
-            )
+    metric_id, scenario_id = get_metric_and_scenario_ids(metric_code, scenario_code)
+
+    cache_key = ("timeseries", metric_code, scenario_code, region_id, start_year, end_year, american)
+    entry = response_cache.get(cache_key)
+    if entry is not None:
+        return cached_json_response(request, entry)
+
+    # Time series and region identifier in one round trip. Unset year bounds are passed as
+    # concrete open bounds rather than NULL so the statement keeps a single range predicate.
+    results = await app.state.pool.fetch(
+        TIMESERIES_SQL, metric_id, scenario_id, region_id,
+        start_year or TIMESERIES_MIN_YEAR, end_year or TIMESERIES_MAX_YEAR
+    )
+
+    if not results:
+        raise HTTPException(
+            status_code=404,
+            detail=f"No time series data found for region {region_id}"
+        )
+    region_identifier = results[0][2]
+
+    # Get metric info and apply unit conversion to all values at once if requested
+    metric = cache.metrics[metric_code]
+    if american:
+        scale, offset, unit = cache.unit_converters[metric['unit']]
+        metric = {**metric, 'unit': unit}
+        converted = np.fromiter((row[1] for row in results), dtype=np.float64, count=len(results))
+        apply_unit_conversion(converted, scale, offset)
+        data = [
+            {"year": row[0], "value": value}
+            for row, value in zip(results, converted.tolist())
+        ]
+    else:
+        data = [{"year": year, "value": value} for year, value, _ in results]
+
+    payload = orjson.dumps({
+        "region_id": region_id,
+        "region_identifier": region_identifier,
+        "metric": metric,
+        "scenario": cache.scenarios[scenario_code],
+        "data": data
+    })
+    return cached_json_response(request, response_cache.put(cache_key, payload))
 
 @app.get("/climate/average/{metric_code}/{scenario_code}/{region_id}",
          response_model=MultiYearAverageResponse,
@@ -667,92 +1093,65 @@ async def get_multi_year_average(
     # Look up metric_id and scenario_id
     metric_id, scenario_id = get_metric_and_scenario_ids(metric_code, scenario_code)
 
-    # Get metric info and determine unit conversion
-    metric_info = MetricInfo(**cache.metrics[metric_code])
-    converted_unit = metric_info.unit
-
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cached_result = None
-            is_cached = False
-
-            # Check for cached value if not forcing recompute
-            if not force_recompute:
-                cached_result = get_cached_average(
-                    cur, region_id, metric_id, scenario_id, start_year, end_year
-                )
-
-            if cached_result:
-                # Return cached value
-                is_cached = True
-                avg_value = float(cached_result['avg_value'])
-                data_points_count = int(cached_result['data_points_count'])
-                computed_at = cached_result['computed_at'].isoformat()
-            else:
-                # Compute new average
-                result = compute_average(
-                    cur, region_id, metric_id, scenario_id, start_year, end_year
-                )
-
-                if result is None:
-                    raise HTTPException(
-                        status_code=404,
-                        detail=f"No data found for region {region_id}, metric '{metric_code}', "
-                               f"scenario '{scenario_code}' in year range {start_year}-{end_year}"
-                    )
+    # Get metric info and determine unit conversion; shared instances are copied before changing the unit
+    metric_info = cache.metric_infos[metric_code]
+
+    # Averages seen recently by this process are served without touching the database
+    cache_key = (region_id, metric_id, scenario_id, start_year, end_year)
+    result = None if force_recompute else average_cache.get(cache_key)
+
+    if result is None:
+        # A cached average is returned as is; otherwise it is computed and stored
+        result = await app.state.pool.fetchrow(
+            MULTI_YEAR_AVERAGE_SQL, region_id, metric_id, scenario_id,
+            start_year, end_year, force_recompute
+        )
 
-                avg_value, data_points_count = result
-
-                # Store the computed average
-                store_computed_average(
-                    cur, conn, region_id, metric_id, scenario_id,
-                    start_year, end_year, avg_value, data_points_count
-                )
-
-                # Get the timestamp of the newly stored record
-                cur.execute("""
-                    SELECT computed_at
-                    FROM climate_averages
-                    WHERE region_id = %s
-                        AND metric_id = %s
-                        AND scenario_id = %s
-                        AND start_year = %s
-                        AND end_year = %s;
-                """, (region_id, metric_id, scenario_id, start_year, end_year))
-
-                timestamp_result = cur.fetchone()
-                computed_at = timestamp_result['computed_at'].isoformat()
-                is_cached = False
-
-            # Apply unit conversion if requested
-            if american:
-                avg_value, converted_unit = convert_to_american_units(avg_value, metric_info.unit)
-                metric_info.unit = converted_unit
-
-            return MultiYearAverageResponse(
-                region_id=region_id,
-                metric=metric_info,
-                scenario=ScenarioInfo(**cache.scenarios[scenario_code]),
-                start_year=start_year,
-                end_year=end_year,
-                average_value=avg_value,
-                data_points_count=data_points_count,
-                cached=is_cached,
-                computed_at=computed_at
+        if result is None:
+            raise HTTPException(
+                status_code=404,
+                detail=f"No data found for region {region_id}, metric '{metric_code}', "
+                       f"scenario '{scenario_code}' in year range {start_year}-{end_year}"
             )
 
+        # The timestamp is formatted once per database read rather than once per request
+        result = dict(result, computed_at=result['computed_at'].isoformat())
+        average_cache.put(cache_key, {**result, 'cached': True})
+
+    avg_value = float(result['avg_value'])
+
+    # Apply unit conversion if requested
+    if american:
+        avg_value, converted_unit = convert_to_american_units(avg_value, metric_info.unit)
+        metric_info = metric_info.model_copy(update={'unit': converted_unit})
+
+    return MultiYearAverageResponse(
+        region_id=region_id,
+        metric=metric_info,
+        scenario=cache.scenario_infos[scenario_code],
+        start_year=start_year,
+        end_year=end_year,
+        average_value=avg_value,
+        data_points_count=result['data_points_count'],
+        cached=result['cached'],
+        computed_at=result['computed_at']
+    )
+
 @app.get("/average-all/{metric_code}/{scenario_code}",
          response_model=MultiYearAverageAllRegionsResponse,
          tags=["Climate Data"])
 async def get_multi_year_average_all_regions(
     metric_code: str,
     scenario_code: str,
+    background_tasks: BackgroundTasks,
     start_year: int = Query(..., ge=1991, le=2100, description="Start year of the range (1991-2100)"),
     end_year: int = Query(..., ge=1991, le=2100, description="End year of the range (1991-2100)"),
     region_ids: list[int] | None = Query(None, description="Filter by specific region IDs"),
     force_recompute: bool = Query(False, description="Force recomputation even if cached values exist"),
     include_summary: bool = Query(True, description="Include statistical summary"),
-    american: bool = Query(False, description="Convert values to American units (Fahrenheit, inches)")
+    american: bool = Query(False, description="Convert values to American units (Fahrenheit, inches)"),
+    columnar: bool = Query(False, description="Return data as parallel region_id, average_value, "
+                                              "and data_points_count arrays")
 ):
     """
     Get multi-year average climate data for all regions (or filtered regions).
@@ -770,13 +1169,14 @@ async def get_multi_year_average_all_regions(
     - force_recompute: Force recalculation even if cached values exist
     - include_summary: Include statistical summary of the averages
     - american: Convert values to American units (Fahrenheit, inches)
+    - columnar: Return data as parallel arrays instead of one object per region
 
     Returns:
     - metric: Full metric information including unit
     - scenario: Full scenario information
     - start_year: Start of the year range
     - end_year: End of the year range
-    - data: List of average values per region
+    - data: List of average values per region, or parallel arrays if columnar
     - summary: Statistical summary (min, max, mean, count)
     - cached_count: Number of results retrieved from cache
     - computed_count: Number of results computed on-the-fly
@@ -790,103 +1190,103 @@ async def get_multi_year_average_all_regions(
 
     # Look up metric_id and scenario_id
     metric_id, scenario_id = get_metric_and_scenario_ids(metric_code, scenario_code)
+    region_ids = canonical_region_ids(region_ids)
+
+    # Cached averages are read and missing ones computed in a single statement.
+    # With a region filter the aggregate is skipped entirely when every requested region is
+    # cached. Without one there is no exact expected count, so the anti-join decides.
+    if region_ids is not None:
+        results = await app.state.pool.fetch(
+            ALL_REGIONS_AVERAGE_REGIONS_SQL, metric_id, scenario_id, start_year, end_year,
+            region_ids, force_recompute
+        )
+    else:
+        results = await app.state.pool.fetch(
+            ALL_REGIONS_AVERAGE_SQL, metric_id, scenario_id, start_year, end_year,
+            force_recompute
+        )
 
-    # Get metric info and determine unit conversion
-    metric_info = MetricInfo(**cache.metrics[metric_code])
-    converted_unit = metric_info.unit
-
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            cached_data = {}
-            cached_count = 0
-            computed_count = 0
-
-            # Get cached averages if not forcing recompute
-            if not force_recompute:
-                cached_data = get_all_cached_averages(
-                    cur, metric_id, scenario_id, start_year, end_year
-                )
-
-            # Compute averages for all regions
-            computed_data = compute_all_averages(
-                cur, metric_id, scenario_id, start_year, end_year
+    if not results:
+        if region_ids:
+            raise HTTPException(
+                status_code=404,
+                detail="No data found for the specified region filter"
             )
+        raise HTTPException(
+            status_code=404,
+            detail=f"No data found for metric '{metric_code}', scenario '{scenario_code}' "
+                   f"in year range {start_year}-{end_year}"
+        )
 
-            if not computed_data:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"No data found for metric '{metric_code}', scenario '{scenario_code}' "
-                           f"in year range {start_year}-{end_year}"
-                )
-
-            # Merge cached and computed data
-            data_points = []
-            regions_to_cache = []
-
-            for region_id, (avg_value, data_points_count) in computed_data.items():
-                # Filter by region_ids if provided
-                if region_ids is not None and region_id not in region_ids:
-                    continue
+    merged_region_ids = []
+    merged_values = []
+    merged_counts = []
+    computed_region_ids = []
+    computed_values = []
+    computed_counts = []
+    for region_id, avg_value, data_points_count, is_cached in results:
+        merged_region_ids.append(region_id)
+        merged_values.append(avg_value)
+        merged_counts.append(data_points_count)
+        if not is_cached:
+            computed_region_ids.append(region_id)
+            computed_values.append(avg_value)
+            computed_counts.append(data_points_count)
+            # Drop this process's copy of a region average that is about to be (re)stored
+            average_cache.pop((region_id, metric_id, scenario_id, start_year, end_year))
+    computed_count = len(computed_region_ids)
+    cached_count = len(results) - computed_count
+
+    # Computed averages are written back after the response is sent
+    if computed_count:
+        background_tasks.add_task(
+            persist_averages, metric_id, scenario_id, start_year, end_year,
+            computed_region_ids, computed_values, computed_counts
+        )
 
-                # Check if we should use cached value
-                if not force_recompute and region_id in cached_data:
-                    cached_count += 1
-                    avg_value = float(cached_data[region_id]['avg_value'])
-                    data_points_count = int(cached_data[region_id]['data_points_count'])
-                else:
-                    computed_count += 1
-                    # Mark this region for caching
-                    regions_to_cache.append((region_id, avg_value, data_points_count))
-
-                # Apply unit conversion if requested
-                display_value = avg_value
-                if american:
-                    display_value, converted_unit = convert_to_american_units(avg_value, metric_info.unit)
-
-                data_points.append(MultiYearAverageDataPoint(
-                    region_id=region_id,
-                    average_value=display_value,
-                    data_points_count=data_points_count
-                ))
-
-            # Store newly computed averages in cache
-            for region_id, avg_value, data_points_count in regions_to_cache:
-                store_computed_average(
-                    cur, conn, region_id, metric_id, scenario_id,
-                    start_year, end_year, avg_value, data_points_count
-                )
-
-            if not data_points:
-                raise HTTPException(
-                    status_code=404,
-                    detail="No data found for the specified region filter"
-                )
-
-            # Calculate summary statistics
-            summary = {}
-            if include_summary:
-                values = [dp.average_value for dp in data_points]
-                summary = {
-                    "min": min(values),
-                    "max": max(values),
-                    "mean": sum(values) / len(values),
-                    "count": len(values)
-                }
-
-            # Update metric info with converted unit
-            if american:
-                metric_info.unit = converted_unit
-
-            return MultiYearAverageAllRegionsResponse(
-                metric=metric_info,
-                scenario=ScenarioInfo(**cache.scenarios[scenario_code]),
-                start_year=start_year,
-                end_year=end_year,
-                data=data_points,
-                summary=summary,
-                cached_count=cached_count,
-                computed_count=computed_count
-            )
+    # Get metric info and apply unit conversion to all values at once if requested
+    metric = cache.metrics[metric_code]
+    values = np.array(merged_values, dtype=np.float64)
+    if american:
+        scale, offset, unit = cache.unit_converters[metric['unit']]
+        metric = {**metric, 'unit': unit}
+        apply_unit_conversion(values, scale, offset)
+
+    value_list = values.tolist()
+    if columnar:
+        data = {
+            "region_id": merged_region_ids,
+            "average_value": value_list,
+            "data_points_count": merged_counts
+        }
+    else:
+        data = [
+            {"region_id": region_id, "average_value": value, "data_points_count": data_points_count}
+            for region_id, value, data_points_count in zip(merged_region_ids, value_list, merged_counts)
+        ]
+
+    # Calculate summary statistics in a single vectorized pass
+    summary = {}
+    if include_summary:
+        summary = {
+            "min": float(values.min()),
+            "max": float(values.max()),
+            "mean": float(values.mean()),
+            "count": len(values)
+        }
+
+    # Plain dicts are serialized by orjson without per-row model validation
+    payload = orjson.dumps({
+        "metric": metric,
+        "scenario": cache.scenarios[scenario_code],
+        "start_year": start_year,
+        "end_year": end_year,
+        "data": data,
+        "summary": summary,
+        "cached_count": cached_count,
+        "computed_count": computed_count
+    })
+    return Response(content=payload, media_type="application/json")
 
 @app.get("/regions/{region_id}/all",
          tags=["Region Data"])
@@ -898,74 +1298,19 @@ async def get_all_region_data(
     Get all available climate data for a specific region.
     Useful for region-specific dashboards or detailed views.
     """
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # Get region info
-            cur.execute("""
-                SELECT region_id, region_identifier, source_country_name, 
-                       source_admin_level, name_1, name_2
-                FROM regions 
-                WHERE region_id = %s;
-            """, (region_id,))
-            
-            region_info = cur.fetchone()
-            if not region_info:
-                raise HTTPException(status_code=404, detail=f"Region {region_id} not found")
-            
-            # Get all climate data for this region
-            query = """
-                SELECT 
-                    m.metric_code,
-                    m.metric_name,
-                    m.unit,
-                    s.scenario_code,
-                    s.scenario_name,
-                    cd.year,
-                    cd.value
-                FROM climate_data cd
-                JOIN metrics m ON cd.metric_id = m.id
-                JOIN scenarios s ON cd.scenario_id = s.id
-                WHERE cd.region_id = %s
-            """
-            params = [region_id]
-            
-            if year:
-                query += " AND cd.year = %s"
-                params.append(year)
-            
-            query += " ORDER BY m.metric_code, s.scenario_code, cd.year;"
-            
-            cur.execute(query, params)
-            climate_data = cur.fetchall()
-            
-            # Organize data by metric and scenario
-            organized_data = {}
-            for row in climate_data:
-                metric_key = row['metric_code']
-                scenario_key = row['scenario_code']
-                
-                if metric_key not in organized_data:
-                    organized_data[metric_key] = {
-                        "metric_name": row['metric_name'],
-                        "unit": row['unit'],
-                        "scenarios": {}
-                    }
-                
-                if scenario_key not in organized_data[metric_key]["scenarios"]:
-                    organized_data[metric_key]["scenarios"][scenario_key] = {
-                        "scenario_name": row['scenario_name'],
-                        "data": []
-                    }
-                
-                organized_data[metric_key]["scenarios"][scenario_key]["data"].append({
-                    "year": row['year'],
-                    "value": row['value']
-                })
-            
-            return {
-                "region": region_info,
-                "climate_data": organized_data
-            }
+    # The region lookup and the data stream run concurrently on separate connections
+    region_info, organized_data = await asyncio.gather(
+        app.state.pool.fetchrow(REGION_INFO_SQL, region_id),
+        fetch_region_climate_data(region_id, year)
+    )
+
+    if not region_info:
+        raise HTTPException(status_code=404, detail=f"Region {region_id} not found")
+
+    return {
+        "region": dict(region_info),
+        "climate_data": organized_data
+    }
 
 @app.get("/regions/{region_id}/center",
          response_model=RegionCenterResponse,
@@ -974,8 +1319,8 @@ async def get_region_center(region_id: int):
     """
     Get the center coordinate (centroid) of a region by its region_id.
 
-    This endpoint retrieves the geometry from the regions table and calculates
-    the centroid using PostGIS ST_Centroid function. The result is returned
+    This endpoint reads the centroid that PostGIS stores alongside each region
+    geometry (a generated ST_Centroid column). The result is returned
     as longitude and latitude coordinates in WGS84 (EPSG:4326).
 
     Parameters:
@@ -986,32 +1331,34 @@ async def get_region_center(region_id: int):
     - longitude: X coordinate of the centroid
     - latitude: Y coordinate of the centroid
     """
-    with get_db_connection() as conn:
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # Query to get the centroid of the region geometry
-            cur.execute("""
-                SELECT
-                    region_id,
-                    ST_X(ST_Centroid(geom)) as longitude,
-                    ST_Y(ST_Centroid(geom)) as latitude
-                FROM regions
-                WHERE region_id = %s;
-            """, (region_id,))
-
-            result = cur.fetchone()
-
-            if not result:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Region with region_id {region_id} not found"
-                )
-
-            return RegionCenterResponse(
-                region_id=result['region_id'],
-                longitude=result['longitude'],
-                latitude=result['latitude']
+    center = region_center_cache.get((region_id,))
+    if center is None:
+        # Query to get the stored centroid of the region geometry
+        result = await app.state.pool.fetchrow(REGION_CENTER_SQL, region_id)
+
+        if not result:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Region with region_id {region_id} not found"
             )
 
+        center = (result['longitude'], result['latitude'])
+        region_center_cache.put((region_id,), center)
+
+    return RegionCenterResponse(
+        region_id=region_id,
+        longitude=center[0],
+        latitude=center[1]
+    )
+
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
\ No newline at end of file
+    # Each worker process opens its own connection pool of up to POOL_MAX_SIZE connections
+    uvicorn.run(
+        f"{Path(__file__).stem}:app",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=WEB_CONCURRENCY
+    )
@@ -4,17 +4,29 @@ Seed CMIP6 climate data from JSON files into PostGIS database.
 This script processes JSON files with naming convention:
 <metric>_global_<scenario>_<start_year>-<end_year>.json
 """
-import json
+import csv
+import io
+import ijson # type: ignore [import-untyped]
 import psycopg2 # type: ignore [import-untyped]
 from psycopg2.extras import execute_values # type: ignore [import-untyped]
+import os
 import re
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
+# Rows buffered in memory before they are written to climate_data
+INSERT_BATCH_SIZE = 10_000
+
 class ClimateDataSeeder:
-    def __init__(self, conn):
+    FILENAME_RE = re.compile(r'^(.+?)_global_(.+?)_(\d{4})-(\d{4})\.json$')
+    YEAR_RE = re.compile(r'_(\d{4})$')
+
+    def __init__(self, conn, conn_params: dict | None = None):
         self.conn = conn
+        # Connection arguments let worker processes open their own connections
+        self.conn_params = conn_params
         self.metric_cache = {}
         self.scenario_cache = {}
         
@@ -76,17 +88,10 @@ class ClimateDataSeeder:
                 );
             """)
             
-            # Create indexes
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_climate_data_region ON climate_data(region_id);")
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_climate_data_metric ON climate_data(metric_id);")
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_climate_data_scenario ON climate_data(scenario_id);")
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_climate_data_year ON climate_data(year);")
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_climate_data_composite ON climate_data(region_id, metric_id, scenario_id, year);")
+            # Secondary climate_data indexes are built after the load, see create_indexes.
+            # Region-prefixed lookups use the index behind the UNIQUE constraint.
             cur.execute("CREATE INDEX idx_climate_averages_lookup ON climate_averages(region_id, metric_id, scenario_id, start_year, end_year);")
             
-            # Create index for performance without foreign key
-            cur.execute("CREATE INDEX IF NOT EXISTS idx_climate_data_region_id ON climate_data(region_id);")
-            
             self.conn.commit()
             print("✅ Climate data tables created successfully")
     
@@ -144,8 +149,7 @@ class ClimateDataSeeder:
         Parse filename to extract metric, scenario, start_year, and end_year.
         Format: <metric>_global_<scenario>_<start_year>-<end_year>.json
         """
-        pattern = r'^(.+?)_global_(.+?)_(\d{4})-(\d{4})\.json$'
-        match = re.match(pattern, filename)
+        match = self.FILENAME_RE.match(filename)
         if not match:
             raise ValueError(f"Filename {filename} doesn't match expected pattern")
         
@@ -155,6 +159,103 @@ class ClimateDataSeeder:
         end_year = int(match.group(4))
         
         return metric, scenario, start_year, end_year
+
+    def create_missing_codes(self, json_files: list[Path]) -> None:
+        """
+        Auto-create metrics and scenarios referenced by filenames but missing from the
+        reference data, with one upsert per table for all files.
+        """
+        metric_codes = set()
+        scenario_codes = set()
+        for json_file in json_files:
+            try:
+                metric_code, scenario_code, _, _ = self.parse_filename(json_file.name)
+            except ValueError:
+                continue
+            metric_codes.add(metric_code)
+            scenario_codes.add(scenario_code)
+
+        missing_metrics = sorted(metric_codes - self.metric_cache.keys())
+        missing_scenarios = sorted(scenario_codes - self.scenario_cache.keys())
+
+        with self.conn.cursor() as cur:
+            if missing_metrics:
+                rows = execute_values(
+                    cur,
+                    """
+                    INSERT INTO metrics (metric_code, metric_name, unit, description)
+                    VALUES %s
+                    ON CONFLICT (metric_code) DO UPDATE
+                    SET metric_code = EXCLUDED.metric_code
+                    RETURNING metric_code, id;
+                    """,
+                    [
+                        (code, code.replace('_', ' ').title(), 'unknown', f'Auto-generated entry for {code}')
+                        for code in missing_metrics
+                    ],
+                    fetch=True
+                )
+                self.metric_cache.update(rows)
+
+            if missing_scenarios:
+                rows = execute_values(
+                    cur,
+                    """
+                    INSERT INTO scenarios (scenario_code, scenario_name, description)
+                    VALUES %s
+                    ON CONFLICT (scenario_code) DO UPDATE
+                    SET scenario_code = EXCLUDED.scenario_code
+                    RETURNING scenario_code, id;
+                    """,
+                    [
+                        (code, code.upper(), f'Auto-generated entry for {code}')
+                        for code in missing_scenarios
+                    ],
+                    fetch=True
+                )
+                self.scenario_cache.update(rows)
+
+        self.conn.commit()
+        if missing_metrics or missing_scenarios:
+            print(f"✅ Auto-created {len(missing_metrics)} metrics and {len(missing_scenarios)} scenarios")
+
+    def create_staging_table(self):
+        """Create the session-local table that climate data batches are copied into."""
+        with self.conn.cursor() as cur:
+            cur.execute("""
+                CREATE TEMP TABLE IF NOT EXISTS climate_data_staging (
+                    region_id INTEGER,
+                    metric_id INTEGER,
+                    scenario_id INTEGER,
+                    year INTEGER,
+                    value NUMERIC(12,4)
+                );
+            """)
+        self.conn.commit()
+
+    def insert_climate_rows(self, cur, rows: list[tuple]) -> None:
+        """
+        Upsert a batch of (region_id, metric_id, scenario_id, year, value) rows.
+        The batch is streamed into the staging table with COPY and merged into
+        climate_data with a single INSERT ... SELECT.
+        """
+        buffer = io.StringIO()
+        csv.writer(buffer).writerows(rows)
+        buffer.seek(0)
+
+        cur.copy_expert(
+            "COPY climate_data_staging (region_id, metric_id, scenario_id, year, value) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer
+        )
+        cur.execute("""
+            INSERT INTO climate_data (region_id, metric_id, scenario_id, year, value)
+            SELECT region_id, metric_id, scenario_id, year, value
+            FROM climate_data_staging
+            ON CONFLICT (region_id, metric_id, scenario_id, year)
+            DO UPDATE SET value = EXCLUDED.value;
+        """)
+        cur.execute("TRUNCATE climate_data_staging;")
     
     def process_json_file(self, filepath: Path) -> int:
         """Process a single JSON file and insert data into database."""
@@ -167,84 +268,53 @@ class ClimateDataSeeder:
             print(f"⚠️  Skipping {filename}: {e}")
             return 0
 
-        # Get or create metric and scenario IDs
-        if metric_code not in self.metric_cache:
-            # Auto-create metric if not in reference data
-            with self.conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO metrics (metric_code, metric_name, unit, description)
-                    VALUES (%s, %s, %s, %s)
-                    ON CONFLICT (metric_code) DO UPDATE
-                    SET metric_code = EXCLUDED.metric_code
-                    RETURNING id;
-                """, (metric_code, metric_code.replace('_', ' ').title(), 'unknown', f'Auto-generated entry for {metric_code}'))
-                self.metric_cache[metric_code] = cur.fetchone()[0]
-                self.conn.commit()
-
-        if scenario_code not in self.scenario_cache:
-            # Auto-create scenario if not in reference data
-            with self.conn.cursor() as cur:
-                cur.execute("""
-                    INSERT INTO scenarios (scenario_code, scenario_name, description)
-                    VALUES (%s, %s, %s)
-                    ON CONFLICT (scenario_code) DO UPDATE
-                    SET scenario_code = EXCLUDED.scenario_code
-                    RETURNING id;
-                """, (scenario_code, scenario_code.upper(), f'Auto-generated entry for {scenario_code}'))
-                self.scenario_cache[scenario_code] = cur.fetchone()[0]
-                self.conn.commit()
-
         metric_id = self.metric_cache[metric_code]
         scenario_id = self.scenario_cache[scenario_code]
 
-        # Load JSON data
-        with open(filepath, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        # Keys look like <metric>_<year>, total_<metric>_<year>, or mean_<metric>_<year>
+        key_prefixes = (f'{metric_code}_', f'total_{metric_code}_', f'mean_{metric_code}_')
 
         # Track regions with and without data
         regions_with_data = set()
         regions_without_data = []
+        inserted = 0
 
-        # Prepare data for bulk insert
-        insert_data = []
-        for region in data:
-            region_id = region['region_id']
-            region_has_data = False
+        with self.conn.cursor() as cur:
+            # Stream regions from the top-level JSON array so only one region is held in
+            # memory at a time, and write rows in batches as they accumulate
+            insert_data = []
+            with open(filepath, 'rb') as f:
+                for region in ijson.items(f, 'item', use_float=True):
+                    region_id = region['region_id']
+                    region_has_data = False
 
-            # Extract year-value pairs from the region object
-            for key, value in region.items():
-                # Look for keys that match pattern: <metric>_<year>
-                if key.startswith(f'{metric_code}_') or key.startswith(f'total_{metric_code}_') or key.startswith(f'mean_{metric_code}_'):
-                    year_match = re.search(r'_(\d{4})$', key)
-                    if year_match:
-                        year = int(year_match.group(1))
-                        if start_year <= year <= end_year and value is not None:
-                            insert_data.append((region_id, metric_id, scenario_id, year, value))
-                            region_has_data = True
+                    # Extract year-value pairs from the region object
+                    for key, value in region.items():
+                        # Look for keys that match pattern: <metric>_<year>
+                        if key.startswith(key_prefixes):
+                            year_match = self.YEAR_RE.search(key)
+                            if year_match:
+                                year = int(year_match.group(1))
+                                if start_year <= year <= end_year and value is not None:
+                                    insert_data.append((region_id, metric_id, scenario_id, year, value))
+                                    region_has_data = True
 
-            # Track regions without data
-            if region_has_data:
-                regions_with_data.add(region_id)
-            else:
-                region_name = region.get('NAME_2') or region.get('NAME_1') or region.get('region_identifier') or f"Region {region_id}"
-                country = region.get('source_country_name') or region.get('COUNTRY') or 'Unknown'
-                regions_without_data.append((region_id, region_name, country))
+                    # Track regions without data
+                    if region_has_data:
+                        regions_with_data.add(region_id)
+                    else:
+                        region_name = region.get('NAME_2') or region.get('NAME_1') or region.get('region_identifier') or f"Region {region_id}"
+                        country = region.get('source_country_name') or region.get('COUNTRY') or 'Unknown'
+                        regions_without_data.append((region_id, region_name, country))
+
+                    if len(insert_data) >= INSERT_BATCH_SIZE:
+                        self.insert_climate_rows(cur, insert_data)
+                        inserted += len(insert_data)
+                        insert_data.clear()
 
-        # Bulk insert using execute_values for efficiency
-        with self.conn.cursor() as cur:
             if insert_data:
-                execute_values(
-                    cur,
-                    """
-                    INSERT INTO climate_data (region_id, metric_id, scenario_id, year, value)
-                    VALUES %s
-                    ON CONFLICT (region_id, metric_id, scenario_id, year)
-                    DO UPDATE SET value = EXCLUDED.value;
-                    """,
-                    insert_data,
-                    template="(%s, %s, %s, %s, %s)",
-                    page_size=1000
-                )
+                self.insert_climate_rows(cur, insert_data)
+                inserted += len(insert_data)
 
             # Insert placeholder NULL records for regions without data
             # This uses the midpoint year as a representative placeholder
@@ -271,16 +341,20 @@ class ClimateDataSeeder:
         self.conn.commit()
 
         # Report results
-        print(f"✅ Inserted {len(insert_data)} data points from {filename}")
+        print(f"✅ Inserted {inserted} data points from {filename}")
         if regions_without_data:
             print(f"   ⚠️  {len(regions_without_data)} regions without climate data (NULL placeholders inserted):")
             for region_id, region_name, country in regions_without_data:
                 print(f"      • Region {region_id}: {region_name} ({country})")
 
-        return len(insert_data)
+        return inserted
     
-    def process_directory(self, directory: Path) -> None:
-        """Process all JSON files in the specified directory."""
+    def process_directory(self, directory: Path, workers: int = 1) -> None:
+        """
+        Process all JSON files in the specified directory.
+        With more than one worker, metric/scenario groups of files are loaded
+        in parallel by separate processes, each on its own database connection.
+        """
         json_files = list(directory.glob('*_global_*.json'))
         
         if not json_files:
@@ -288,14 +362,71 @@ class ClimateDataSeeder:
             return
         
         print(f"Found {len(json_files)} JSON files to process")
+        self.create_missing_codes(json_files)
+        self.create_staging_table()
+        
+        # Files for the same metric and scenario can overlap on (region_id, year), so each
+        # metric/scenario group is loaded by one worker in file order. Workers then never
+        # upsert the same climate_data rows, which rules out deadlocks between them and
+        # makes the surviving value for an overlapping row independent of timing.
+        groups: dict[tuple, list[Path]] = {}
+        for json_file in sorted(json_files):
+            try:
+                metric, scenario, _, _ = self.parse_filename(json_file.name)
+                key: tuple = (metric, scenario)
+            except ValueError:
+                key = (json_file.name,)
+            groups.setdefault(key, []).append(json_file)
         
         total_records = 0
-        for json_file in json_files:
-            records = self.process_json_file(json_file)
-            total_records += records
+        if workers > 1 and self.conn_params is not None:
+            with ProcessPoolExecutor(max_workers=min(workers, len(groups))) as executor:
+                futures = [
+                    executor.submit(
+                        load_json_files, self.conn_params,
+                        self.metric_cache, self.scenario_cache, group
+                    )
+                    for group in groups.values()
+                ]
+                for future in futures:
+                    total_records += future.result()
+        else:
+            for group in groups.values():
+                for json_file in group:
+                    total_records += self.process_json_file(json_file)
         
         print(f"\n✅ Successfully imported {total_records:,} climate data records")
     
+    def create_indexes(self):
+        """
+        Create the secondary climate_data indexes. Building them once over the
+        loaded table is much faster than maintaining them row by row during the load.
+        """
+        print("\nCreating climate_data indexes...")
+        with self.conn.cursor() as cur:
+            # Every API query filters on metric and scenario together, or on region, so
+            # single-column indexes on metric_id, scenario_id or year only add write and
+            # storage cost; drop them from databases seeded before they were removed
+            for index in ("idx_climate_data_metric", "idx_climate_data_scenario", "idx_climate_data_year"):
+                cur.execute(f"DROP INDEX IF EXISTS {index};")
+            # Covers the API's per-year and per-range queries, including value, so they can run as index-only scans
+            cur.execute("CREATE INDEX IF NOT EXISTS idx_climate_data_lookup ON climate_data(metric_id, scenario_id, year, region_id) INCLUDE (value);")
+        self.conn.commit()
+        print("✅ climate_data indexes created")
+    
+    def cluster_climate_data(self):
+        """
+        Rewrite climate_data in (metric_id, scenario_id, year) order so that
+        each per-year and range aggregate reads contiguous heap pages, then
+        refresh planner statistics.
+        """
+        print("\nClustering climate_data on idx_climate_data_lookup...")
+        with self.conn.cursor() as cur:
+            cur.execute("CLUSTER climate_data USING idx_climate_data_lookup;")
+            cur.execute("ANALYZE climate_data;")
+        self.conn.commit()
+        print("✅ climate_data clustered and analyzed")
+    
     def validate_import(self):
         """Validate the imported data."""
         with self.conn.cursor() as cur:
@@ -340,6 +471,19 @@ class ClimateDataSeeder:
             for scenario, count in scenarios_summary:
                 print(f"     {scenario}: {count:,}")
 
+def load_json_files(conn_params: dict, metric_cache: dict, scenario_cache: dict,
+                    filepaths: list[Path]) -> int:
+    """Load JSON files in order on a new connection; runs in a worker process."""
+    conn = psycopg2.connect(**conn_params)
+    try:
+        seeder = ClimateDataSeeder(conn, conn_params)
+        seeder.metric_cache = metric_cache
+        seeder.scenario_cache = scenario_cache
+        seeder.create_staging_table()
+        return sum(seeder.process_json_file(filepath) for filepath in filepaths)
+    finally:
+        conn.close()
+
 def main():
     parser = argparse.ArgumentParser(description='Load CMIP6 climate data JSON files into PostGIS')
     parser.add_argument('data_directory', help='Directory containing JSON files')
@@ -348,21 +492,24 @@ def main():
     parser.add_argument('--database', default='cmip6_atlas', help='Database name')
     parser.add_argument('--user', default='postgres', help='Database user')
     parser.add_argument('--password', default='postgres', help='Database password')
+    parser.add_argument('--workers', default=min(8, os.cpu_count() or 1), type=int,
+                        help='Number of metric/scenario file groups to load in parallel')
     
     args = parser.parse_args()
     
     # Connect to database
     try:
-        conn = psycopg2.connect(
-            host=args.host,
-            port=args.port,
-            database=args.database,
-            user=args.user,
-            password=args.password
-        )
+        conn_params = {
+            'host': args.host,
+            'port': args.port,
+            'database': args.database,
+            'user': args.user,
+            'password': args.password
+        }
+        conn = psycopg2.connect(**conn_params)
         print(f"✅ Connected to PostgreSQL database '{args.database}'")
         
-        seeder = ClimateDataSeeder(conn)
+        seeder = ClimateDataSeeder(conn, conn_params)
         
         # Create tables
         seeder.create_tables()
@@ -376,7 +523,12 @@ def main():
             print(f"❌ Directory {data_dir} does not exist")
             sys.exit(1)
         
-        seeder.process_directory(data_dir)
+        seeder.process_directory(data_dir, workers=args.workers)
+        
+        # Build secondary indexes over the loaded table, then physically
+        # order the rows for the API's lookup pattern
+        seeder.create_indexes()
+        seeder.cluster_climate_data()
         
         # Validate import
         seeder.validate_import()
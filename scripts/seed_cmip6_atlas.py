@@ -1,20 +1,74 @@
 #!/usr/bin/env python3
-import json
+import csv
+import io
+import ijson # type: ignore [import-untyped]
 import psycopg2 # type: ignore [import-untyped]
-from psycopg2.extras import RealDictCursor # type: ignore [import-untyped]
+from psycopg2.extras import execute_values # type: ignore [import-untyped]
 from psycopg2.extensions import connection as PostgresConnection # type: ignore [import-untyped]
-from shapely.geometry import shape # type: ignore [import-untyped]
 import sys
 import argparse
+import os
+import struct
+import time
+from collections import deque
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+
+# Columns loaded from the GeoJSON file, in the order rows are written for COPY
+REGION_COLUMNS = (
+    'region_id', 'region_identifier', 'source_country_code', 'source_country_name',
+    'source_admin_level', 'source_filename', 'gid_0', 'country', 'gid_1', 'name_1',
+    'varname_1', 'nl_name_1', 'type_1', 'engtype_1', 'cc_1', 'hasc_1', 'iso_1',
+    'gid_2', 'name_2', 'varname_2', 'nl_name_2', 'type_2', 'engtype_2', 'cc_2', 'hasc_2',
+    'geom'
+)
+
+# GeoJSON property keys for every REGION_COLUMNS entry except geom, in the same order
+PROP_KEYS = (
+    'region_id', 'region_identifier', 'source_country_code', 'source_country_name',
+    'source_admin_level', 'source_filename', 'GID_0', 'COUNTRY', 'GID_1', 'NAME_1',
+    'VARNAME_1', 'NL_NAME_1', 'TYPE_1', 'ENGTYPE_1', 'CC_1', 'HASC_1', 'ISO_1',
+    'GID_2', 'NAME_2', 'VARNAME_2', 'NL_NAME_2', 'TYPE_2', 'ENGTYPE_2', 'CC_2', 'HASC_2'
+)
+
+# REGION_COLUMNS stored as INTEGER; every other property column is text
+INTEGER_COLUMNS = frozenset({'region_id', 'source_admin_level'})
+
+# Binary COPY framing: file header and trailer, per-row field count, NULL field
+COPY_BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('>ii', 0, 0)
+COPY_BINARY_TRAILER = struct.pack('>h', -1)
+COPY_BINARY_FIELD_COUNT = struct.pack('>h', len(REGION_COLUMNS))
+COPY_BINARY_NULL = struct.pack('>i', -1)
+# NULL marker for the CSV COPY path
+CSV_NULL = '\\N'
+
+# Bytes handed to the server per read while streaming a binary COPY
+COPY_READ_SIZE = 1024 * 1024
+
+# EWKB type flag marking an embedded SRID
+EWKB_SRID_FLAG = 0x20000000
+
+# Rows per INSERT statement when loading with --load-method values
+INSERT_PAGE_SIZE = 1000
+
+# Features per batch, both for building load rows in a worker and for each COPY
+FEATURE_BATCH_SIZE = 1000
+
+# Minimum seconds between progress updates while building load rows
+PROGRESS_INTERVAL = 0.25
+
+# Parallel workers per query for the geometry validation scans
+VALIDATION_PARALLEL_WORKERS = 4
 
 def create_table(connection: PostgresConnection) -> None:
     """Create the regions table with all necessary columns."""
     with connection.cursor() as cursor:
         cursor.execute("DROP TABLE IF EXISTS regions CASCADE;")
         
-        # Create table with all fields from the global regions GeoJSON file
+        # Create table with all fields from the global regions GeoJSON file.
+        # It stays UNLOGGED while loading to skip WAL writes; finalize_table makes it durable
         create_table_sql = """
-        CREATE TABLE regions (
+        CREATE UNLOGGED TABLE regions (
             id SERIAL PRIMARY KEY,
             region_id INTEGER,
             region_identifier VARCHAR(255),
@@ -41,13 +95,30 @@ def create_table(connection: PostgresConnection) -> None:
             engtype_2 VARCHAR(100),
             cc_2 VARCHAR(50),
             hasc_2 VARCHAR(50),
-            geom GEOMETRY(GEOMETRY, 4326)
-        );
+            geom GEOMETRY(MULTIPOLYGON, 4326),
+            -- Kept in sync with geom by Postgres so the API never computes centroids per request
+            centroid GEOMETRY(POINT, 4326) GENERATED ALWAYS AS (ST_Centroid(geom)) STORED
+        ) WITH (autovacuum_enabled = false);
         """
         cursor.execute(create_table_sql)
         
+        connection.commit()
+        print("✅ Table 'regions' created successfully")
+
+def create_indexes(connection: PostgresConnection, index_type: str = 'spgist') -> None:
+    """
+    Create the regions indexes. Run after the load so each index is built
+    once over the full table instead of being maintained row by row.
+    Spatial indexes use SP-GiST by default, which builds faster and is
+    smaller than GiST; pass index_type='gist' for older PostGIS versions.
+    """
+    with connection.cursor() as cursor:
+        # More sort memory makes the spatial index builds noticeably faster
+        cursor.execute("SET LOCAL maintenance_work_mem = '1GB';")
+        
         # Create spatial index
-        cursor.execute("CREATE INDEX idx_regions_geom ON regions USING GIST (geom);")
+        cursor.execute(f"CREATE INDEX idx_regions_geom ON regions USING {index_type.upper()} (geom);")
+        cursor.execute(f"CREATE INDEX idx_regions_centroid ON regions USING {index_type.upper()} (centroid);")
         
         # Create indexes on commonly queried fields
         cursor.execute("CREATE INDEX idx_regions_region_id ON regions (region_id);")
@@ -56,146 +127,327 @@ def create_table(connection: PostgresConnection) -> None:
         cursor.execute("CREATE INDEX idx_regions_name_1 ON regions (name_1);")
         
         connection.commit()
-        print("✅ Table 'regions' created successfully")
+        print("✅ Indexes on 'regions' created successfully")
+
+def _wkt_position(position: list) -> str:
+    # regions.geom is a 2D MULTIPOLYGON, so Z and M ordinates are dropped
+    return f"{position[0]} {position[1]}"
+
+def _wkt_positions(positions: list) -> str:
+    return "(" + ", ".join(map(_wkt_position, positions)) + ")"
+
+def _wkt_rings(rings: list) -> str:
+    return "(" + ", ".join(map(_wkt_positions, rings)) + ")"
+
+def geojson_to_wkt(geometry: dict) -> str:
+    """
+    Serialize a GeoJSON geometry to WKT directly from its coordinate arrays,
+    without building an intermediate geometry object.
+    """
+    geom_type = geometry['type']
+    if geom_type == 'GeometryCollection':
+        members = geometry.get('geometries') or []
+        if not members:
+            return "GEOMETRYCOLLECTION EMPTY"
+        return "GEOMETRYCOLLECTION (" + ", ".join(map(geojson_to_wkt, members)) + ")"
+
+    coordinates = geometry.get('coordinates')
+    wkt_type = geom_type.upper()
+    if not coordinates:
+        return f"{wkt_type} EMPTY"
+    if geom_type == 'Point':
+        return f"POINT ({_wkt_position(coordinates)})"
+    if geom_type in ('LineString', 'MultiPoint'):
+        return wkt_type + " " + _wkt_positions(coordinates)
+    if geom_type in ('Polygon', 'MultiLineString'):
+        return wkt_type + " " + _wkt_rings(coordinates)
+    if geom_type == 'MultiPolygon':
+        return "MULTIPOLYGON (" + ", ".join(map(_wkt_rings, coordinates)) + ")"
+    raise ValueError(f"Unsupported geometry type: {geom_type}")
+
+def as_multipolygon(geometry: dict) -> dict:
+    """Promote a single polygon so every row matches the MultiPolygon geom column."""
+    if geometry['type'] == 'Polygon':
+        return {'type': 'MultiPolygon', 'coordinates': [geometry['coordinates']]}
+    return geometry
+
+def check_position_dimensions(polygons: list) -> None:
+    """
+    Raise ValueError unless every position in a MultiPolygon's coordinates has
+    the same number of ordinates, between 2 and 4.
+    """
+    dims = {len(position) for polygon in polygons for ring in polygon for position in ring}
+    if len(dims) > 1 or not dims <= {2, 3, 4}:
+        raise ValueError(f"Inconsistent coordinate dimensions in geometry: {sorted(dims)}")
+
+def multipolygon_to_ewkb(geometry: dict, srid: int = 4326) -> bytes:
+    """
+    Serialize a GeoJSON (Multi)Polygon to little-endian 2D EWKB with the SRID
+    embedded, which PostGIS reads directly in a binary COPY. Z and M ordinates
+    are dropped to match the 2D geom column, as on the WKT path.
+    """
+    geometry = as_multipolygon(geometry)
+    if geometry['type'] != 'MultiPolygon':
+        raise ValueError(f"Unsupported geometry type: {geometry['type']}")
+    
+    polygons = geometry['coordinates']
+    check_position_dimensions(polygons)
+    
+    parts = [struct.pack('<BIII', 1, 6 | EWKB_SRID_FLAG, srid, len(polygons))]
+    for polygon in polygons:
+        parts.append(struct.pack('<BII', 1, 3, len(polygon)))
+        for ring in polygon:
+            parts.append(struct.pack('<I', len(ring)))
+            parts.append(struct.pack(f'<{2 * len(ring)}d', *[c for position in ring for c in position[:2]]))
+    return b''.join(parts)
+
+def feature_row(feature: dict) -> tuple:
+    """Build the REGION_COLUMNS values for one GeoJSON feature."""
+    props = feature['properties']
+    
+    # Convert geometry to EWKT so it is parsed with the SRID attached
+    geometry = as_multipolygon(feature['geometry'])
+    if geometry['type'] == 'MultiPolygon':
+        check_position_dimensions(geometry['coordinates'])
+    geom_ewkt = f"SRID=4326;{geojson_to_wkt(geometry)}"
+    
+    # Prepare values, handling None/null values
+    return tuple(map(props.get, PROP_KEYS)) + (geom_ewkt,)
+
+def feature_copy_record(feature: dict) -> bytes:
+    """Encode one GeoJSON feature as a binary COPY row of REGION_COLUMNS."""
+    props = feature['properties']
+    parts = [COPY_BINARY_FIELD_COUNT]
+    for column, value in zip(REGION_COLUMNS, map(props.get, PROP_KEYS)):
+        if value is None:
+            parts.append(COPY_BINARY_NULL)
+        elif column in INTEGER_COLUMNS:
+            parts.append(struct.pack('>ii', 4, int(value)))
+        else:
+            data = str(value).encode('utf-8')
+            parts.append(struct.pack('>i', len(data)))
+            parts.append(data)
+    
+    geom = multipolygon_to_ewkb(feature['geometry'])
+    parts.append(struct.pack('>i', len(geom)))
+    parts.append(geom)
+    return b''.join(parts)
+
+class ChunkReader:
+    """
+    Minimal file-like object serving read() from an iterable of byte chunks,
+    so copy_expert can stream them without joining them into one buffer.
+    """
+    def __init__(self, chunks):
+        self.chunks = iter(chunks)
+        self.pending = bytearray()
+
+    def read(self, size: int = -1) -> bytes:
+        while size < 0 or len(self.pending) < size:
+            chunk = next(self.chunks, None)
+            if chunk is None:
+                break
+            self.pending += chunk
+        if size < 0:
+            size = len(self.pending)
+        data = bytes(self.pending[:size])
+        del self.pending[:size]
+        return data
+
+def copy_binary_rows(cur, records: list[bytes]) -> None:
+    """Load a batch of pre-encoded binary rows into regions with one binary COPY."""
+    cur.copy_expert(
+        f"COPY regions ({', '.join(REGION_COLUMNS)}) FROM STDIN WITH (FORMAT binary)",
+        ChunkReader(chain((COPY_BINARY_HEADER,), records, (COPY_BINARY_TRAILER,))),
+        size=COPY_READ_SIZE
+    )
+
+def copy_rows(cur, rows: list[tuple]) -> None:
+    """Load a batch of rows into regions with one CSV COPY."""
+    # None is written as an unquoted \N, the NULL marker below, so empty strings
+    # (unquoted empty fields) load as '' rather than NULL
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(
+        tuple(CSV_NULL if value is None else value for value in row) for row in rows
+    )
+    buffer.seek(0)
+    cur.copy_expert(
+        f"COPY regions ({', '.join(REGION_COLUMNS)}) FROM STDIN "
+        f"WITH (FORMAT csv, NULL '{CSV_NULL}')",
+        buffer
+    )
 
-def insert_features(conn, geojson_file):
+def insert_rows(cur, rows: list[tuple]) -> None:
+    """Load rows into regions with multi-row INSERTs, for setups where COPY is not an option."""
+    execute_values(
+        cur,
+        f"INSERT INTO regions ({', '.join(REGION_COLUMNS)}) VALUES %s",
+        rows,
+        template="(" + ", ".join(["%s"] * (len(REGION_COLUMNS) - 1)) + ", ST_Multi(ST_GeomFromEWKT(%s)))",
+        page_size=INSERT_PAGE_SIZE
+    )
+
+def build_rows(features: list[dict], load_method: str = 'binary') -> list:
+    """Build the load rows for a batch of features. Runs in a worker process when --workers > 1."""
+    if load_method == 'binary':
+        return [feature_copy_record(feature) for feature in features]
+    return [feature_row(feature) for feature in features]
+
+def feature_batches(f, batch_size: int = FEATURE_BATCH_SIZE):
+    """Stream features from a GeoJSON file in lists of up to batch_size."""
+    batch = []
+    for feature in ijson.items(f, 'features.item', use_float=True):
+        batch.append(feature)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+def insert_features(conn, geojson_file, load_method: str = 'binary', workers: int = 1):
     """Insert features from GeoJSON file into PostGIS."""
-    # Load GeoJSON file
-    with open(geojson_file, 'r', encoding='utf-8') as f:
-        data = json.load(f)
+    load_rows = {'binary': copy_binary_rows, 'copy': copy_rows, 'values': insert_rows}[load_method]
+    total = 0
+    last_print = time.monotonic()
     
-    if data['type'] != 'FeatureCollection':
-        raise ValueError("Input file must be a GeoJSON FeatureCollection")
+    def report_progress():
+        # Throttled by elapsed time so terminal writes stay off the load's critical path
+        nonlocal last_print
+        now = time.monotonic()
+        if now - last_print >= PROGRESS_INTERVAL:
+            print(f"✅ Imported {total} features", end='\r')
+            last_print = now
     
-    features = data['features']
-    total = len(features)
-    print(f"Found {total} features to import")
+    # Features are streamed in batches and each batch is written as soon as its rows
+    # are built, so parsing overlaps the database writes and memory stays at a few
+    # batches. Everything is still loaded in one transaction and committed once.
+    with open(geojson_file, 'rb') as f, conn.cursor() as cur:
+        def load(rows: list):
+            nonlocal total
+            load_rows(cur, rows)
+            total += len(rows)
+            report_progress()
+        
+        if workers > 1:
+            # Geometry serialization is CPU-bound and independent per feature, so batches
+            # are converted in worker processes; at most two batches per worker are in flight
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                pending = deque()
+                for batch in feature_batches(f):
+                    pending.append(executor.submit(build_rows, batch, load_method))
+                    if len(pending) >= workers * 2:
+                        load(pending.popleft().result())
+                while pending:
+                    load(pending.popleft().result())
+        else:
+            for batch in feature_batches(f):
+                load(build_rows(batch, load_method))
     
+    if not total:
+        conn.rollback()
+        raise ValueError("Input file must be a GeoJSON FeatureCollection with at least one feature")
+    conn.commit()
+    print(f"\n✅ Successfully imported all {total} features")
+
+def finalize_table(conn) -> None:
+    """
+    Make regions durable and re-enable autovacuum, then vacuum and analyze
+    the loaded table once.
+    """
     with conn.cursor() as cur:
-        insert_sql = """
-        INSERT INTO regions (
-            region_id, region_identifier, source_country_code, source_country_name,
-            source_admin_level, source_filename, gid_0, country, gid_1, name_1,
-            varname_1, nl_name_1, type_1, engtype_1, cc_1, hasc_1, iso_1,
-            gid_2, name_2, varname_2, nl_name_2, type_2, engtype_2, cc_2, hasc_2,
-            geom
-        ) VALUES (
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-            %s, %s, %s, %s, %s, %s, %s, %s, %s, %s,
-            %s, %s, %s, %s, %s, ST_GeomFromText(%s, 4326)
-        )
-        """
-        
-        batch_size = 100
-        for i, feature in enumerate(features):
-            props = feature['properties']
-            
-            # Convert geometry to WKT
-            geom = shape(feature['geometry'])
-            geom_wkt = geom.wkt
-            
-            # Prepare values, handling None/null values
-            values = (
-                props.get('region_id'),
-                props.get('region_identifier'),
-                props.get('source_country_code'),
-                props.get('source_country_name'),
-                props.get('source_admin_level'),
-                props.get('source_filename'),
-                props.get('GID_0'),
-                props.get('COUNTRY'),
-                props.get('GID_1'),
-                props.get('NAME_1'),
-                props.get('VARNAME_1'),
-                props.get('NL_NAME_1'),
-                props.get('TYPE_1'),
-                props.get('ENGTYPE_1'),
-                props.get('CC_1'),
-                props.get('HASC_1'),
-                props.get('ISO_1'),
-                props.get('GID_2'),
-                props.get('NAME_2'),
-                props.get('VARNAME_2'),
-                props.get('NL_NAME_2'),
-                props.get('TYPE_2'),
-                props.get('ENGTYPE_2'),
-                props.get('CC_2'),
-                props.get('HASC_2'),
-                geom_wkt
-            )
-            
-            cur.execute(insert_sql, values)
-            
-            # Commit in batches
-            if (i + 1) % batch_size == 0:
-                conn.commit()
-                print(f"✅ Imported {i + 1}/{total} features", end='\r')
-        
-        conn.commit()
-        print(f"\n✅ Successfully imported all {total} features")
+        # Writes the finished table and its indexes to WAL in one pass
+        cur.execute("ALTER TABLE regions SET LOGGED;")
+        cur.execute("ALTER TABLE regions RESET (autovacuum_enabled);")
+    conn.commit()
+    
+    # VACUUM cannot run inside a transaction block
+    conn.autocommit = True
+    try:
+        with conn.cursor() as cur:
+            cur.execute("VACUUM ANALYZE regions;")
+    finally:
+        conn.autocommit = False
+    print("✅ Table 'regions' vacuumed and analyzed")
 
 def validate_import(conn):
     """Validate the import by checking row count and geometry validity."""
-    with conn.cursor(cursor_factory=RealDictCursor) as cur:
-        # Check total count
-        cur.execute("SELECT COUNT(*) as count FROM regions;")
-        total = cur.fetchone()['count']
-        print("\n📊 Validation Results:")
-        print(f"   Total features: {total}")
+    with conn.cursor() as cur:
+        # The GEOS validity checks are CPU-bound; let the planner spread the
+        # validation scans across parallel workers even on small tables
+        cur.execute(f"SET max_parallel_workers_per_gather = {VALIDATION_PARALLEL_WORKERS};")
+        cur.execute("SET parallel_setup_cost = 0;")
+        cur.execute("SET parallel_tuple_cost = 0;")
+        cur.execute("SET min_parallel_table_scan_size = 0;")
+        
+        # Find invalid geometries and their reasons with one GEOS validity check per row;
+        # OFFSET 0 keeps the subquery from being flattened, which would evaluate it twice
+        cur.execute("""
+            SELECT
+                id,
+                region_id,
+                region_identifier,
+                source_country_name,
+                name_1,
+                name_2,
+                (detail).reason as invalid_reason
+            FROM (
+                SELECT id, region_id, region_identifier, source_country_name,
+                       name_1, name_2, ST_IsValidDetail(geom) as detail
+                FROM regions
+                OFFSET 0
+            ) checked
+            WHERE NOT (detail).valid
+            ORDER BY region_id;
+        """)
+        invalid_rows = cur.fetchall()
         
-        # Check admin level distribution
+        # Fix exactly the rows found above instead of re-checking every geometry
+        # ST_MakeValid may return a Polygon or a collection; keep the polygonal
+        # parts as a MultiPolygon to match the column type
+        if invalid_rows:
+            cur.execute(
+                "UPDATE regions SET geom = ST_Multi(ST_CollectionExtract(ST_MakeValid(geom), 3)) "
+                "WHERE id = ANY(%s);",
+                ([row[0] for row in invalid_rows],)
+            )
+            conn.commit()
+        
+        # Total count, admin level distribution and geometry types in one scan
         cur.execute("""
-            SELECT source_admin_level, COUNT(*) as count 
-            FROM regions 
-            GROUP BY source_admin_level 
-            ORDER BY source_admin_level;
+            SELECT
+                source_admin_level,
+                ST_GeometryType(geom) as geom_type,
+                GROUPING(source_admin_level, ST_GeometryType(geom)) as grouping_set,
+                COUNT(*) as count
+            FROM regions
+            GROUP BY GROUPING SETS ((source_admin_level), (ST_GeometryType(geom)), ())
+            ORDER BY grouping_set, source_admin_level, geom_type;
         """)
+        stats = cur.fetchall()
+        levels = [(level, count) for level, _, grouping_set, count in stats if grouping_set == 1]
+        geom_types = [(geom_type, count) for _, geom_type, grouping_set, count in stats if grouping_set == 2]
+        total = next((count for _, _, grouping_set, count in stats if grouping_set == 3), 0)
+        
+        print("\n📊 Validation Results:")
+        print(f"   Total features: {total}")
+        
         print("   Features by admin level:")
-        for row in cur.fetchall():
-            level = row['source_admin_level'] or 'NULL'
-            print(f"     Level {level}: {row['count']}")
-        
-        # Check for invalid geometries
-        cur.execute("SELECT COUNT(*) as count FROM regions WHERE NOT ST_IsValid(geom);")
-        invalid = cur.fetchone()['count']
-        if invalid > 0:
-            print(f"   ⚠️  Warning: {invalid} invalid geometries found")
-
-            # Get details about invalid geometries
-            cur.execute("""
-                SELECT
-                    region_id,
-                    region_identifier,
-                    source_country_name,
-                    name_1,
-                    name_2,
-                    ST_IsValidReason(geom) as invalid_reason
-                FROM regions
-                WHERE NOT ST_IsValid(geom)
-                ORDER BY region_id;
-            """)
+        for level, count in levels:
+            print(f"     Level {level or 'NULL'}: {count}")
+        
+        if invalid_rows:
+            print(f"   ⚠️  Warning: {len(invalid_rows)} invalid geometries found")
             print("   \n   Invalid geometries details:")
-            for row in cur.fetchall():
-                region_name = row['name_2'] or row['name_1'] or row['region_identifier'] or f"Region {row['region_id']}"
-                country = row['source_country_name'] or 'Unknown'
-                print(f"     • {region_name} ({country}) - {row['invalid_reason']}")
-
-            # Attempt to fix invalid geometries
-            cur.execute("UPDATE regions SET geom = ST_MakeValid(geom) WHERE NOT ST_IsValid(geom);")
-            conn.commit()
+            for _, region_id, region_identifier, country, name_1, name_2, invalid_reason in invalid_rows:
+                region_name = name_2 or name_1 or region_identifier or f"Region {region_id}"
+                print(f"     • {region_name} ({country or 'Unknown'}) - {invalid_reason}")
             print("\n   ✅ Invalid geometries fixed using ST_MakeValid()")
         else:
             print("   ✅ All geometries are valid")
         
-        # Check geometry types
-        cur.execute("""
-            SELECT ST_GeometryType(geom) as geom_type, COUNT(*) as count 
-            FROM regions 
-            GROUP BY ST_GeometryType(geom);
-        """)
         print("   Geometry types:")
-        for row in cur.fetchall():
-            print(f"     {row['geom_type']}: {row['count']}")
+        for geom_type, count in geom_types:
+            print(f"     {geom_type}: {count}")
 
 def main():
     parser = argparse.ArgumentParser(description='Load GeoJSON into PostGIS for Martin tile serving')
@@ -205,6 +457,13 @@ def main():
     parser.add_argument('--database', default='cmip6_atlas', help='Database name (default: regions_db)')
     parser.add_argument('--user', default='postgres', help='Database user (default: postgres)')
     parser.add_argument('--password', default='postgres', help='Database password (default: postgres)')
+    parser.add_argument('--load-method', default='binary', choices=['binary', 'copy', 'values'],
+                        help='Load features with a binary COPY, a CSV COPY, or batched multi-row INSERTs '
+                             '(default: binary)')
+    parser.add_argument('--index-type', default='spgist', choices=['spgist', 'gist'],
+                        help='Spatial index access method, SP-GiST requires PostGIS 2.5+ (default: spgist)')
+    parser.add_argument('--workers', default=min(8, os.cpu_count() or 1), type=int,
+                        help='Worker processes used to build load rows (default: min(8, CPU count))')
     
     args = parser.parse_args()
     
@@ -221,6 +480,8 @@ def main():
         
         # Enable PostGIS extension
         with conn.cursor() as cursor:
+            # The load is re-run from scratch on failure, so commits need not wait for WAL flushes
+            cursor.execute("SET synchronous_commit = OFF;")
             cursor.execute("CREATE EXTENSION IF NOT EXISTS postgis;")
             conn.commit()
             print("✅ PostGIS extension enabled")
@@ -229,11 +490,17 @@ def main():
         create_table(conn)
         
         # Insert features
-        insert_features(conn, args.geojson_file)
+        insert_features(conn, args.geojson_file, load_method=args.load_method, workers=args.workers)
+        
+        # Create indexes over the loaded table
+        create_indexes(conn, index_type=args.index_type)
         
         # Validate
         validate_import(conn)
         
+        # Make the table durable, restore autovacuum and refresh statistics
+        finalize_table(conn)
+        
         print("\n✅ Import completed successfully!")
         print("   pg_tileserv should now serve tiles at: http://localhost:8080/public.regions.json")
         
@@ -0,0 +1,82 @@
+"""
+Tests for the climate API that run without a database.
+The connection pool is replaced by a fake that records the statements it receives.
+"""
+import asyncio
+import re
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+import climate_api  # noqa: E402
+
+EMPTY_BINARY_COPY = b"PGCOPY\n\xff\r\n\x00" + b"\x00" * 8 + b"\xff\xff"
+
+
+class FakeConnection:
+    def __init__(self):
+        self.copies = []
+
+    async def copy_from_query(self, query, *args, output, format):
+        self.copies.append((query, args))
+        await output(EMPTY_BINARY_COPY)
+
+
+class FakePool:
+    def __init__(self, connection):
+        self.connection = connection
+
+    def acquire(self):
+        return self
+
+    async def __aenter__(self):
+        return self.connection
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def call_bulk(region_ids):
+    connection = FakeConnection()
+    climate_api.app.state.pool = FakePool(connection)
+    climate_api.cache.metric_ids = {"tas": 1}
+    climate_api.cache.scenario_ids = {"ssp245": 2}
+    result = asyncio.run(climate_api.get_bulk_climate_data(
+        2050, metrics=["tas"], scenarios=["ssp245"], region_ids=region_ids
+    ))
+    return result, connection.copies
+
+
+def assert_inlinable(query, args):
+    # copy_from_query inlines every $n as a literal; None or a missing argument breaks the SQL
+    placeholders = {int(n) for n in re.findall(r"\$(\d+)", query)}
+    assert placeholders == set(range(1, len(args) + 1))
+    assert all(arg is not None for arg in args)
+
+
+def test_bulk_without_region_ids():
+    result, copies = call_bulk(None)
+    assert result == {}
+    [(query, args)] = copies
+    assert query == climate_api.BULK_CLIMATE_COPY_SQL
+    assert_inlinable(query, args)
+
+
+def test_bulk_with_region_ids():
+    result, copies = call_bulk([3, 1, 3])
+    assert result == {}
+    [(query, args)] = copies
+    assert query == climate_api.BULK_CLIMATE_COPY_REGIONS_SQL
+    assert args[3] == [1, 3]
+    assert_inlinable(query, args)
+
+
+def test_etag_matches():
+    etag = '"abc123"'
+    assert climate_api.etag_matches('"abc123"', etag)
+    assert climate_api.etag_matches('W/"abc123"', etag)
+    assert climate_api.etag_matches('"other", W/"abc123"', etag)
+    assert climate_api.etag_matches("*", etag)
+    assert not climate_api.etag_matches('"other"', etag)
+    assert not climate_api.etag_matches(None, etag)